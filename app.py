@@ -6,6 +6,7 @@ import sys
 from datetime import date, timedelta
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
@@ -16,8 +17,9 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from utils.data_manager import (
     all_practice_dates,
     current_streak,
-    load_csv,
+    load_all_sessions,
     load_goals,
+    load_sheets,
     longest_streak,
     practice_session_counts,
 )
@@ -40,18 +42,20 @@ st.caption("Track your practice, measure your progress, crush your goals.")
 # ---------------------------------------------------------------------------
 # Key metrics row
 # ---------------------------------------------------------------------------
-dates = all_practice_dates()
-counts = practice_session_counts()
+# One sessions frame feeds every aggregate, so a failed sheet read warns once
+sessions = load_all_sessions()
+dates = all_practice_dates(sessions)
+counts = practice_session_counts(sessions)
 total_sessions = sum(counts.values())
 
-# Sessions this week
+# Sessions this week (dates is sorted and unique, so this is a binary search)
 today = date.today()
 week_start = today - timedelta(days=today.weekday())  # Monday
-sessions_this_week = sum(1 for d in dates if d >= week_start)
+sessions_this_week = len(dates) - int(dates.searchsorted(pd.Timestamp(week_start)))
 
 # Sessions this month
 month_start = today.replace(day=1)
-sessions_this_month = sum(1 for d in dates if d >= month_start)
+sessions_this_month = len(dates) - int(dates.searchsorted(pd.Timestamp(month_start)))
 
 col1, col2, col3, col4 = st.columns(4)
 col1.metric("Total Sessions", total_sessions)
@@ -62,69 +66,90 @@ col4.metric("This Month", sessions_this_month)
 # ---------------------------------------------------------------------------
 # Practice breakdown
 # ---------------------------------------------------------------------------
+@st.cache_data(show_spinner=False)
+def _heatmap_figure(date_counts: pd.Series) -> go.Figure:
+    """Calendar heatmap for daily session counts indexed from Jan 1.
+    Cached on the counts so reruns with unchanged data skip the build."""
+    start = date_counts.index[0].date()
+    # Create a heatmap with weeks as columns and days of week as rows:
+    # a dense 7 x n_weeks grid, days after today stay NaN (rendered as gaps)
+    days = np.arange(len(date_counts))
+    weekday = (days + start.weekday()) % 7  # 0=Mon, 6=Sun
+    week_offset = days // 7  # weeks counted from Jan 1
+    n_weeks = int(week_offset[-1]) + 1
+    z = np.full((7, n_weeks), np.nan)
+    z[weekday, week_offset] = date_counts.to_numpy()
+    hover_dates = np.full((7, n_weeks), "", dtype=object)
+    hover_dates[weekday, week_offset] = date_counts.index.strftime("%b %d").to_numpy()
+
+    day_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+    fig = go.Figure(data=go.Heatmap(
+        z=z,
+        colorscale=[
+            [0, "#1a1f2e"],
+            [0.01, "#1a1f2e"],
+            [0.5, "#2e7d32"],
+            [1.0, "#66bb6a"],
+        ],
+        showscale=False,
+        hovertemplate="Date: %{customdata}<br>Sessions: %{z}<extra></extra>",
+        customdata=hover_dates,
+        hoverongaps=False,
+        ygap=3,
+        xgap=3,
+    ))
+    fig.update_yaxes(
+        tickvals=list(range(7)),
+        ticktext=day_labels,
+        autorange="reversed",
+    )
+    fig.update_xaxes(showticklabels=False)
+    fig.update_layout(
+        height=200,
+        margin=dict(l=40, r=10, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _category_pie(labels: tuple, values: tuple) -> go.Figure:
+    """Donut chart of session counts per category."""
+    fig = go.Figure(data=[go.Pie(
+        labels=list(labels),
+        values=list(values),
+        hole=0.45,
+        marker=dict(colors=["#2e7d32", "#66bb6a", "#1b5e20", "#4caf50", "#81c784", "#388e3c"]),
+        textinfo="label+value",
+    )])
+    fig.update_layout(
+        height=220,
+        margin=dict(l=10, r=10, t=10, b=10),
+        paper_bgcolor="rgba(0,0,0,0)",
+        showlegend=False,
+    )
+    return fig
+
+
 st.markdown("---")
 col_left, col_right = st.columns([3, 2])
 
 with col_left:
     st.subheader("Practice Frequency")
 
-    if dates:
+    if len(dates):
         # Build a calendar heatmap for the current year
         year = today.year
         start = date(year, 1, 1)
         end = today
         all_days = pd.date_range(start, end, freq="D")
-        date_counts = pd.Series(0, index=all_days)
 
         # Count sessions per day across all categories
-        for name in ("ball_striking", "putting", "testing", "three_hole_loop", "wedge_ladder", "putting_testing"):
-            df = load_csv(name)
-            if not df.empty and "date" in df.columns:
-                for d in pd.to_datetime(df["date"]).dt.normalize():
-                    if d in date_counts.index:
-                        date_counts[d] += 1
-
-        # Create a heatmap with weeks as columns and days of week as rows
-        df_cal = pd.DataFrame({
-            "date": all_days,
-            "count": date_counts.values,
-        })
-        df_cal["weekday"] = df_cal["date"].dt.weekday  # 0=Mon, 6=Sun
-        df_cal["week"] = df_cal["date"].dt.isocalendar().week.astype(int)
-        # Adjust week for year boundary
-        df_cal["week_offset"] = ((df_cal["date"] - pd.Timestamp(start)).dt.days) // 7
-
-        day_labels = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-
-        fig = go.Figure(data=go.Heatmap(
-            x=df_cal["week_offset"],
-            y=df_cal["weekday"],
-            z=df_cal["count"],
-            colorscale=[
-                [0, "#1a1f2e"],
-                [0.01, "#1a1f2e"],
-                [0.5, "#2e7d32"],
-                [1.0, "#66bb6a"],
-            ],
-            showscale=False,
-            hovertemplate="Date: %{customdata}<br>Sessions: %{z}<extra></extra>",
-            customdata=df_cal["date"].dt.strftime("%b %d"),
-            ygap=3,
-            xgap=3,
-        ))
-        fig.update_yaxes(
-            tickvals=list(range(7)),
-            ticktext=day_labels,
-            autorange="reversed",
-        )
-        fig.update_xaxes(showticklabels=False)
-        fig.update_layout(
-            height=200,
-            margin=dict(l=40, r=10, t=10, b=10),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        date_counts = sessions["date"].value_counts().reindex(all_days, fill_value=0).astype("int32")
+
+        st.plotly_chart(_heatmap_figure(date_counts), use_container_width=True)
     else:
         st.info("No practice sessions yet. Log your first session to see the heatmap!")
 
@@ -139,18 +164,9 @@ with col_right:
             "wedge_ladder": "Wedge Ladder",
             "putting_testing": "Putting Testing",
         }
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=[labels.get(k, k) for k in counts.keys()],
-            values=list(counts.values()),
-            hole=0.45,
-            marker=dict(colors=["#2e7d32", "#66bb6a", "#1b5e20", "#4caf50", "#81c784", "#388e3c"]),
-            textinfo="label+value",
-        )])
-        fig_pie.update_layout(
-            height=220,
-            margin=dict(l=10, r=10, t=10, b=10),
-            paper_bgcolor="rgba(0,0,0,0)",
-            showlegend=False,
+        fig_pie = _category_pie(
+            tuple(labels.get(k, k) for k in counts.keys()),
+            tuple(counts.values()),
         )
         st.plotly_chart(fig_pie, use_container_width=True)
     else:
@@ -162,33 +178,40 @@ with col_right:
 st.markdown("---")
 st.subheader("Recent Activity")
 
+
+def _summarize(df: pd.DataFrame) -> pd.Series:
+    """Build a "Drill: value, ..." string per row, skipping blanks and zeros."""
+    data_cols = [c for c in df.columns if c != "date"]
+    m = df[data_cols].melt(var_name="drill", value_name="v", ignore_index=False)
+    m = m.dropna(subset=["v"])
+    num = pd.to_numeric(m["v"], errors="coerce")
+    keep = num.ne(0)
+    m, num = m[keep], num[keep]
+    values = m["v"].astype(str).where(num.isna(), np.trunc(num).astype("Int64").astype(str))
+    pieces = m["drill"].str.replace("_", " ").str.title() + ": " + values
+    return pieces.groupby(level=0, sort=False).agg(", ".join).reindex(df.index, fill_value="")
+
+
+activity_sources = [("ball_striking", "Ball Striking"), ("putting", "Putting"), ("testing", "Short Game Testing"), ("three_hole_loop", "3-Hole Loop"), ("wedge_ladder", "Wedge Ladder"), ("putting_testing", "Putting Testing")]
+# Skip categories with no logged sessions before touching their frames
+activity_sources = [(name, label) for name, label in activity_sources if counts.get(name)]
+activity_frames = load_sheets(name for name, _ in activity_sources)
+
 recent_rows = []
-for name, label in [("ball_striking", "Ball Striking"), ("putting", "Putting"), ("testing", "Short Game Testing"), ("three_hole_loop", "3-Hole Loop"), ("wedge_ladder", "Wedge Ladder"), ("putting_testing", "Putting Testing")]:
-    df = load_csv(name)
+for name, label in activity_sources:
+    df = activity_frames[name]
     if not df.empty:
-        df = df.copy()
-        df["category"] = label
-        # Summarize non-date, non-category columns
-        data_cols = [c for c in df.columns if c not in ("date", "category")]
-
-        def _summarize(row):
-            parts = []
-            for col, val in row.items():
-                if pd.isna(val) or val == 0:
-                    continue
-                try:
-                    parts.append(f"{col.replace('_', ' ').title()}: {int(float(val))}")
-                except (ValueError, TypeError):
-                    parts.append(f"{col.replace('_', ' ').title()}: {val}")
-            return ", ".join(parts)
-
-        df["summary"] = df[data_cols].apply(_summarize, axis=1)
-        recent_rows.append(df[["date", "category", "summary"]])
+        # Only the 10 newest rows per category can make the overall top 10
+        df = df.nlargest(10, "date")
+        recent_rows.append(pd.DataFrame({
+            "date": df["date"],
+            "category": label,
+            "summary": _summarize(df),
+        }))
 
 if recent_rows:
     recent_df = pd.concat(recent_rows, ignore_index=True)
-    recent_df["date"] = pd.to_datetime(recent_df["date"])
-    recent_df = recent_df.sort_values("date", ascending=False).head(10)
+    recent_df = recent_df.nlargest(10, "date")
     recent_df["date"] = recent_df["date"].dt.strftime("%b %d, %Y")
     recent_df.columns = ["Date", "Category", "Details"]
     st.dataframe(recent_df, use_container_width=True, hide_index=True)
@@ -24,6 +24,10 @@ st.set_page_config(page_title="Practice Log", page_icon="📝", layout="wide")
 st.title("📝 Practice Log")
 st.caption("Record your practice sessions across all categories.")
 
+# Only the most recent rows are shown in the session tables. Row labels are
+# preserved through tail/rename so delete still targets the right sheet row.
+RECENT_SESSIONS_LIMIT = 100
+
 
 def _show_table_with_delete(raw_df, display_df, sheet_name, label, key_prefix):
     """Show a dataframe with row selection and a delete button."""
@@ -35,6 +39,7 @@ def _show_table_with_delete(raw_df, display_df, sheet_name, label, key_prefix):
         sorted_display,
         use_container_width=True,
         hide_index=True,
+        column_config={"Date": st.column_config.DateColumn(format="MMM DD, YYYY")},
         on_select="rerun",
         selection_mode="single-row",
         key=f"{key_prefix}_table",
@@ -43,7 +48,8 @@ def _show_table_with_delete(raw_df, display_df, sheet_name, label, key_prefix):
     if event.selection.rows:
         sel_pos = event.selection.rows[0]
         orig_idx = original_indices[sel_pos]
-        row_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else ""
+        sel_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else None
+        row_date = sel_date.strftime("%b %d, %Y") if pd.notna(sel_date) else ""
         if st.button(
             f"🗑️  Delete selected {label} session ({row_date})",
             key=f"{key_prefix}_delete_btn",
@@ -123,8 +129,6 @@ with tab_bs:
     st.markdown("#### Recent Ball Striking Sessions")
     bs_df = load_ball_striking()
     if not bs_df.empty:
-        display = bs_df.copy()
-        display["date"] = pd.to_datetime(display["date"]).dt.strftime("%b %d, %Y")
         col_map = {
             "date": "Date",
             "mechanical_no_results": "Mechanical",
@@ -136,7 +140,7 @@ with tab_bs:
             "crazy_shit_1x": "Crazy Shit",
             "one_handed_pitch_3x": "1-Hand Pitch",
         }
-        display = display.rename(columns=col_map)
+        display = bs_df.tail(RECENT_SESSIONS_LIMIT).rename(columns=col_map)
         _show_table_with_delete(bs_df, display, "ball_striking", "ball striking", "bs")
     else:
         st.info("No ball striking sessions logged yet.")
@@ -186,15 +190,13 @@ with tab_putt:
     st.markdown("#### Recent Putting Sessions")
     putt_df = load_putting()
     if not putt_df.empty:
-        display = putt_df.copy()
-        display["date"] = pd.to_datetime(display["date"]).dt.strftime("%b %d, %Y")
         col_map = {
             "date": "Date",
             "three_foot_drill": "3-Foot Drill",
             "guess_the_slope": "Guess Slope",
             "lag_drill": "Lag Drill",
         }
-        display = display.rename(columns=col_map)
+        display = putt_df.tail(RECENT_SESSIONS_LIMIT).rename(columns=col_map)
         _show_table_with_delete(putt_df, display, "putting", "putting", "putt")
     else:
         st.info("No putting sessions logged yet.")
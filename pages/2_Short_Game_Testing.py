@@ -6,13 +6,21 @@ import sys
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from utils.data_manager import delete_csv_row, load_testing, load_testing_lookup, save_testing_session
+from utils.data_manager import (
+    data_version,
+    delete_csv_row,
+    load_testing,
+    load_testing_lookup,
+    save_testing_session,
+    testing_lookup_version,
+)
 
 st.set_page_config(page_title="Short Game Testing", page_icon="🎯", layout="wide")
 
@@ -52,24 +60,78 @@ SHOT_CSV_COLS = [
 ]
 
 
+@st.cache_resource(show_spinner=False)
+def _build_hcap_idx(lookup_version: float) -> dict:
+    """Index the lookup tables per shot type as
+    ({score: handicap}, min score, max score, worst hcap, best hcap).
+    Keyed on the lookup version so a re-import rebuilds the index."""
+    lookup = load_testing_lookup()
+    return {
+        shot_name: (
+            {e["score"]: e["handicap"] for e in table},
+            min(e["score"] for e in table),
+            max(e["score"] for e in table),
+            table[0]["handicap"],
+            table[-1]["handicap"],
+        )
+        for shot_name, table in lookup.items()
+        if table
+    }
+
+
+LOOKUP_VERSION = testing_lookup_version()
+HCAP_IDX = _build_hcap_idx(LOOKUP_VERSION)
+
+# Highest score in each lookup table (20 when a shot type has no table)
+MAX_SCORE = {s: HCAP_IDX[s][2] if s in HCAP_IDX else 20 for s in SHOT_TYPES}
+
+
 def score_to_handicap(shot_type: str, score: int):
     """Look up the handicap for a given shot type and raw score.
     Returns None if the score is outside the lookup table range."""
-    table = lookup.get(shot_type, [])
-    for entry in table:
-        if entry["score"] == score:
-            return entry["handicap"]
-    # If score exceeds the table, extrapolate or return the best/worst
-    if not table:
+    idx = HCAP_IDX.get(shot_type)
+    if idx is None:
         return None
-    scores = [e["score"] for e in table]
-    if score < min(scores):
-        return table[0]["handicap"]  # worst
-    if score > max(scores):
-        return table[-1]["handicap"]  # best
+    by_score, lo, hi, worst, best = idx
+    hcap = by_score.get(score)
+    if hcap is not None:
+        return hcap
+    # If score exceeds the table, return the best/worst
+    if score < lo:
+        return worst
+    if score > hi:
+        return best
     return None
 
 
+def shot_handicaps(shot_type: str, raw: pd.Series) -> pd.Series:
+    """Vectorized score_to_handicap over a column of raw scores.
+    Blank, non-numeric and unmatched scores map to NaN."""
+    idx = HCAP_IDX.get(shot_type)
+    if idx is None:
+        return pd.Series(np.nan, index=raw.index)
+    by_score, lo, hi, worst, best = idx
+    scores = np.trunc(pd.to_numeric(raw, errors="coerce"))
+    return scores.map(by_score).mask(scores < lo, worst).mask(scores > hi, best)
+
+
+@st.cache_data(show_spinner=False)
+def build_history(_test_df: pd.DataFrame, test_version: tuple, lookup_version: float) -> pd.DataFrame:
+    """Per-session handicaps for every shot type plus their average, sorted
+    by date. Cached on the data and lookup versions (the frame itself is
+    not hashed) so slider/selectbox reruns reuse it."""
+    test_df = _test_df
+    hist_df = pd.DataFrame({"date": test_df["date"]})
+    for shot_name, csv_col in zip(SHOT_TYPES, SHOT_CSV_COLS):
+        if csv_col in test_df.columns:
+            hcaps = shot_handicaps(shot_name, test_df[csv_col])
+            if hcaps.notna().any():
+                hist_df[shot_name] = hcaps
+    hist_df["avg_handicap"] = hist_df[[c for c in SHOT_TYPES if c in hist_df.columns]].mean(axis=1)
+    hist_df = hist_df.dropna(subset=["avg_handicap"])
+    return hist_df.sort_values("date").reset_index(drop=True)
+
+
 # ---------------------------------------------------------------------------
 # Score entry form
 # ---------------------------------------------------------------------------
@@ -84,12 +146,10 @@ with st.form("testing_form", clear_on_submit=True):
     cols = st.columns(4)
     for i, (shot_name, csv_col) in enumerate(zip(SHOT_TYPES, SHOT_CSV_COLS)):
         with cols[i % 4]:
-            table = lookup.get(shot_name, [])
-            max_score = max(e["score"] for e in table) if table else 20
             scores[csv_col] = st.number_input(
                 shot_name,
                 min_value=0,
-                max_value=max_score + 5,
+                max_value=MAX_SCORE[shot_name] + 5,
                 value=0,
                 step=1,
                 key=f"test_{csv_col}",
@@ -120,7 +180,7 @@ st.caption("Enter scores above (outside the form) or review your most recent tes
 test_df = load_testing()
 if not test_df.empty:
     latest = test_df.iloc[-1]
-    st.markdown(f"**Showing results for:** {pd.to_datetime(latest['date']).strftime('%b %d, %Y')}")
+    st.markdown(f"**Showing results for:** {latest['date'].strftime('%b %d, %Y')}")
 
     hcap_data = []
     total_handicap = 0.0
@@ -192,28 +252,9 @@ st.markdown("---")
 st.subheader("Testing History")
 
 if not test_df.empty and len(test_df) > 0:
-    # Build full history with per-shot-type handicaps
-    history = []
-    for _, row in test_df.iterrows():
-        entry = {"date": pd.to_datetime(row["date"])}
-        hcaps = []
-        for shot_name, csv_col in zip(SHOT_TYPES, SHOT_CSV_COLS):
-            raw = row.get(csv_col)
-            if pd.notna(raw) and raw != "" and raw != "na":
-                try:
-                    raw_int = int(float(raw))
-                    hcap = score_to_handicap(shot_name, raw_int)
-                    if hcap is not None:
-                        entry[shot_name] = hcap
-                        hcaps.append(hcap)
-                except (ValueError, TypeError):
-                    pass
-        if hcaps:
-            entry["avg_handicap"] = sum(hcaps) / len(hcaps)
-            history.append(entry)
-
-    if history:
-        hist_df = pd.DataFrame(history).sort_values("date").reset_index(drop=True)
+    hist_df = build_history(test_df, data_version(test_df), LOOKUP_VERSION)
+
+    if not hist_df.empty:
         total_sessions = len(hist_df)
 
         # --- Controls ---
@@ -311,16 +352,12 @@ if not test_df.empty and len(test_df) > 0:
 
     # Full history table
     st.markdown("#### All Test Results")
-    display_df = test_df.copy()
-    if "date" in display_df.columns:
-        display_df["date"] = pd.to_datetime(display_df["date"]).dt.strftime("%b %d, %Y")
     # Drop internal columns
-    drop_cols = [c for c in ["total", "avg_handicap", "adj", "handicap"] if c in display_df.columns]
-    display_df = display_df.drop(columns=drop_cols, errors="ignore")
+    drop_cols = [c for c in ["total", "avg_handicap", "adj", "handicap"] if c in test_df.columns]
     col_map = {"date": "Date"}
     for shot_name, csv_col in zip(SHOT_TYPES, SHOT_CSV_COLS):
         col_map[csv_col] = shot_name
-    display_df = display_df.rename(columns=col_map)
+    display_df = test_df.drop(columns=drop_cols).rename(columns=col_map)
     sorted_display = display_df.sort_values("Date", ascending=False) if "Date" in display_df.columns else display_df
     original_indices = sorted_display.index.tolist()
     sorted_display = sorted_display.reset_index(drop=True)
@@ -329,6 +366,7 @@ if not test_df.empty and len(test_df) > 0:
         sorted_display,
         use_container_width=True,
         hide_index=True,
+        column_config={"Date": st.column_config.DateColumn(format="MMM DD, YYYY")},
         on_select="rerun",
         selection_mode="single-row",
         key="test_table",
@@ -337,7 +375,8 @@ if not test_df.empty and len(test_df) > 0:
     if event.selection.rows:
         sel_pos = event.selection.rows[0]
         orig_idx = original_indices[sel_pos]
-        row_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else ""
+        sel_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else None
+        row_date = sel_date.strftime("%b %d, %Y") if pd.notna(sel_date) else ""
         if st.button(
             f"🗑️  Delete selected test session ({row_date})",
             key="test_delete_btn",
@@ -11,8 +11,14 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+try:
+    import bottleneck as bn
+except ImportError:  # optional speed-up; falls back to pandas rolling
+    bn = None
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from utils.chart_style import LEGEND_TOP, TRANSPARENT_LAYOUT
 from utils.data_manager import delete_csv_row, load_three_hole_loop, save_three_hole_loop_round
 
 st.set_page_config(page_title="3-Hole Loop", page_icon="🌙", layout="wide")
@@ -29,6 +35,7 @@ HOLES = [
     {"num": 3, "par": 4, "has_fairway": True},
 ]
 TOTAL_PAR = sum(h["par"] for h in HOLES)
+SCORE_COLS = [f"h{h['num']}_score" for h in HOLES]
 
 # ---------------------------------------------------------------------------
 # Entry form
@@ -86,74 +93,134 @@ if df.empty:
     st.info("No rounds logged yet. Play the loop and log your first round above!")
     st.stop()
 
-# Ensure proper types
-for h in HOLES:
-    n = h["num"]
-    df[f"h{n}_score"] = pd.to_numeric(df[f"h{n}_score"], errors="coerce")
-
-df["total_score"] = df["h1_score"] + df["h2_score"] + df["h3_score"]
+# Row-wise total in one reduction; a blank hole leaves the total blank
+df["total_score"] = df[SCORE_COLS].sum(axis=1, min_count=len(SCORE_COLS))
 df["vs_par"] = df["total_score"] - TOTAL_PAR
-df["date"] = pd.to_datetime(df["date"])
-df = df.sort_values("date").reset_index(drop=True)
 
 total_rounds = len(df)
 
 # ---------------------------------------------------------------------------
 # Helper to compute percentages from Y/N columns
 # ---------------------------------------------------------------------------
-def _yn_pct(series):
-    valid = series.dropna()
-    valid = valid[valid.isin(["Y", "N"])]
-    if len(valid) == 0:
-        return 0.0
-    return (valid == "Y").sum() / len(valid) * 100
+def _yes(frame, col):
+    """Boolean Series of the Y/N flag ``col`` (blank counts as No); all False
+    if the column is missing."""
+    if col not in frame.columns:
+        return pd.Series(False, index=frame.index)
+    return frame[col].fillna(False).astype(bool)
+
+
+def _moving_avg(values, window):
+    """Trailing mean over up to ``window`` points, skipping NaN; partial
+    windows at the start (same as ``rolling(window, min_periods=1)``)."""
+    arr = np.asarray(values, dtype=np.float64)
+    if bn is not None:
+        return bn.move_mean(arr, window=window, min_count=1)
+    return pd.Series(arr).rolling(window=window, min_periods=1).mean().to_numpy()
+
+
+def _flags(frame, cols):
+    """Stack Y/N flag columns into an (n_rows, len(cols)) boolean array."""
+    return np.column_stack([_yes(frame, c).to_numpy() for c in cols])
 
 
 def _yn_pct_series(col_names):
     """Compute percentage across multiple Y/N columns for each row,
     then return overall percentage."""
-    total_y = 0
-    total_valid = 0
-    for col in col_names:
-        if col in df.columns:
-            valid = df[col].dropna()
-            valid = valid[valid.isin(["Y", "N"])]
-            total_y += (valid == "Y").sum()
-            total_valid += len(valid)
+    cols = [c for c in col_names if c in df.columns]
+    if not cols:
+        return 0.0
+    flags = df[cols]
+    total_valid = int(flags.notna().to_numpy().sum())
+    total_y = int(flags.fillna(False).to_numpy(dtype=bool).sum())
     if total_valid == 0:
         return 0.0
     return total_y / total_valid * 100
 
 
+# ---------------------------------------------------------------------------
+# Cached chart builders (keyed on the plotted values and slider setting, so
+# reruns that don't touch the data or the slider reuse the same figure)
+# ---------------------------------------------------------------------------
+@st.cache_data(max_entries=16, show_spinner=False)
+def _score_figure(dates: tuple, scores: tuple, ma_window: int) -> go.Figure:
+    """Total score per round with a trailing moving average and par line."""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates, y=scores,
+        mode="lines+markers",
+        line=dict(color="#66bb6a", width=2),
+        marker=dict(size=8),
+        name="Score",
+    ))
+    fig.add_trace(go.Scatter(
+        x=dates, y=_moving_avg(scores, ma_window),
+        mode="lines",
+        line=dict(color="#ffffff", width=3),
+        name=f"{ma_window}-Round Moving Avg",
+    ))
+    fig.add_hline(
+        y=TOTAL_PAR, line_dash="dash", line_color="#f44336", opacity=0.5,
+        annotation_text=f"Par ({TOTAL_PAR})", annotation_position="top left",
+    )
+    fig.update_layout(
+        yaxis_title="Total Score",
+        xaxis_title="Date",
+        height=350,
+        **TRANSPARENT_LAYOUT,
+        legend=LEGEND_TOP,
+    )
+    return fig
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _stats_figure(dates: tuple, fairway: tuple, gir: tuple, ud: tuple,
+                  window: int) -> go.Figure:
+    """Rolling fairway / GIR / up-and-down percentages per round."""
+    fig = go.Figure()
+    for values, name, color in [
+        (fairway, "Fairway %", "#66bb6a"),
+        (gir, "GIR %", "#42a5f5"),
+        (ud, "Up/Down %", "#ffa726"),
+    ]:
+        fig.add_trace(go.Scatter(
+            x=dates, y=_moving_avg(values, window),
+            mode="lines+markers", name=name,
+            line=dict(color=color, width=2), marker=dict(size=5),
+        ))
+    fig.update_layout(
+        yaxis_title="Percentage",
+        xaxis_title="Date",
+        height=300,
+        **TRANSPARENT_LAYOUT,
+        legend=LEGEND_TOP,
+    )
+    return fig
+
+
 # ---------------------------------------------------------------------------
 # Summary metrics
 # ---------------------------------------------------------------------------
 st.markdown("---")
 st.subheader("Summary")
 
+# vs_par is total - par row by row, so its mean is just the offset average
 scoring_avg = df["total_score"].mean()
-vs_par_avg = df["vs_par"].mean()
+vs_par_avg = scoring_avg - TOTAL_PAR
 
 fairway_pct = _yn_pct_series(["h1_fairway", "h3_fairway"])
 gir_pct = _yn_pct_series(["h1_gir", "h2_gir", "h3_gir"])
 
 # Up/down: only count conversions where there was a chance
-ud_chances = 0
-ud_converts = 0
-for h in HOLES:
-    n = h["num"]
-    chance_col = f"h{n}_ud_chance"
-    convert_col = f"h{n}_ud_convert"
-    if chance_col in df.columns and convert_col in df.columns:
-        chances = df[chance_col] == "Y"
-        ud_chances += chances.sum()
-        ud_converts += ((df[chance_col] == "Y") & (df[convert_col] == "Y")).sum()
+ud_chance_mat = _flags(df, [f"h{h['num']}_ud_chance" for h in HOLES])
+ud_convert_mat = _flags(df, [f"h{h['num']}_ud_convert" for h in HOLES]) & ud_chance_mat
+ud_chances = int(ud_chance_mat.sum())
+ud_converts = int(ud_convert_mat.sum())
 ud_pct = (ud_converts / ud_chances * 100) if ud_chances > 0 else 0.0
 
 penalty_cols = [f"h{h['num']}_penalty" for h in HOLES]
-total_penalties = sum(
-    (df[col] == "Y").sum() for col in penalty_cols if col in df.columns
-)
+pen_mat = _flags(df, penalty_cols)
+total_penalties = int(pen_mat.sum())
 penalties_per_round = total_penalties / total_rounds if total_rounds > 0 else 0
 
 m1, m2, m3, m4, m5, m6 = st.columns(6)
@@ -183,37 +250,8 @@ if total_rounds >= 2:
             key="loop_ma",
         )
     with trend_c2:
-        plot_df = df.copy()
-        plot_df["moving_avg"] = plot_df["total_score"].rolling(
-            window=ma_window, min_periods=1
-        ).mean()
-
-        fig_score = go.Figure()
-        fig_score.add_trace(go.Scatter(
-            x=plot_df["date"], y=plot_df["total_score"],
-            mode="lines+markers",
-            line=dict(color="#66bb6a", width=2),
-            marker=dict(size=8),
-            name="Score",
-        ))
-        fig_score.add_trace(go.Scatter(
-            x=plot_df["date"], y=plot_df["moving_avg"],
-            mode="lines",
-            line=dict(color="#ffffff", width=3),
-            name=f"{ma_window}-Round Moving Avg",
-        ))
-        fig_score.add_hline(
-            y=TOTAL_PAR, line_dash="dash", line_color="#f44336", opacity=0.5,
-            annotation_text=f"Par ({TOTAL_PAR})", annotation_position="top left",
-        )
-        fig_score.update_layout(
-            yaxis_title="Total Score",
-            xaxis_title="Date",
-            height=350,
-            margin=dict(l=40, r=20, t=20, b=40),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        fig_score = _score_figure(
+            tuple(df["date"]), tuple(df["total_score"].astype("float64")), ma_window,
         )
         st.plotly_chart(fig_score, use_container_width=True)
 else:
@@ -228,7 +266,10 @@ col_hole_chart, col_stats_chart = st.columns(2)
 with col_hole_chart:
     st.subheader("Per-Hole Averages")
     hole_labels = [f"Hole {h['num']}" for h in HOLES]
-    hole_avgs = [df[f"h{h['num']}_score"].mean() for h in HOLES]
+    # One column-wise reduction over the (rounds x holes) score array
+    hole_avgs = np.nanmean(
+        df[SCORE_COLS].to_numpy(dtype=np.float32, na_value=np.nan), axis=0
+    )
     hole_pars = [h["par"] for h in HOLES]
 
     fig_holes = go.Figure()
@@ -250,10 +291,8 @@ with col_hole_chart:
         barmode="group",
         yaxis_title="Strokes",
         height=300,
-        margin=dict(l=40, r=20, t=20, b=40),
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        **TRANSPARENT_LAYOUT,
+        legend=LEGEND_TOP,
     )
     st.plotly_chart(fig_holes, use_container_width=True)
 
@@ -277,60 +316,28 @@ with col_stats_chart:
         round_stats = pd.DataFrame({"date": df["date"]})
 
         # Fairway: 2 chances per round (holes 1 and 3)
-        fw_hits = ((df.get("h1_fairway", pd.Series()) == "Y").astype(int) +
-                   (df.get("h3_fairway", pd.Series()) == "Y").astype(int))
+        fw_hits = _flags(df, ["h1_fairway", "h3_fairway"]).sum(axis=1)
         round_stats["fairway_pct"] = fw_hits / 2 * 100
 
         # GIR: 3 chances per round
-        gir_hits = sum(
-            (df[f"h{h['num']}_gir"] == "Y").astype(int) for h in HOLES
-        )
+        gir_hits = _flags(df, [f"h{h['num']}_gir" for h in HOLES]).sum(axis=1)
         round_stats["gir_pct"] = gir_hits / 3 * 100
 
         # Up/Down: variable chances
-        ud_chance_per_round = sum(
-            (df[f"h{h['num']}_ud_chance"] == "Y").astype(int) for h in HOLES
-        )
-        ud_convert_per_round = sum(
-            ((df[f"h{h['num']}_ud_chance"] == "Y") &
-             (df[f"h{h['num']}_ud_convert"] == "Y")).astype(int) for h in HOLES
-        )
-        round_stats["ud_pct"] = np.where(
-            ud_chance_per_round > 0,
-            ud_convert_per_round / ud_chance_per_round * 100,
-            np.nan,
+        ud_chance_per_round = ud_chance_mat.sum(axis=1)
+        round_stats["ud_pct"] = np.divide(
+            ud_convert_mat.sum(axis=1) * 100,
+            ud_chance_per_round,
+            out=np.full(len(df), np.nan),
+            where=ud_chance_per_round > 0,
         )
 
-        # Rolling averages
-        for col in ["fairway_pct", "gir_pct", "ud_pct"]:
-            round_stats[f"{col}_roll"] = round_stats[col].rolling(
-                window=stat_window, min_periods=1
-            ).mean()
-
-        fig_stats = go.Figure()
-        fig_stats.add_trace(go.Scatter(
-            x=round_stats["date"], y=round_stats["fairway_pct_roll"],
-            mode="lines+markers", name="Fairway %",
-            line=dict(color="#66bb6a", width=2), marker=dict(size=5),
-        ))
-        fig_stats.add_trace(go.Scatter(
-            x=round_stats["date"], y=round_stats["gir_pct_roll"],
-            mode="lines+markers", name="GIR %",
-            line=dict(color="#42a5f5", width=2), marker=dict(size=5),
-        ))
-        fig_stats.add_trace(go.Scatter(
-            x=round_stats["date"], y=round_stats["ud_pct_roll"],
-            mode="lines+markers", name="Up/Down %",
-            line=dict(color="#ffa726", width=2), marker=dict(size=5),
-        ))
-        fig_stats.update_layout(
-            yaxis_title="Percentage",
-            xaxis_title="Date",
-            height=300,
-            margin=dict(l=40, r=20, t=20, b=40),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+        fig_stats = _stats_figure(
+            tuple(round_stats["date"]),
+            tuple(round_stats["fairway_pct"]),
+            tuple(round_stats["gir_pct"]),
+            tuple(round_stats["ud_pct"]),
+            stat_window,
         )
         st.plotly_chart(fig_stats, use_container_width=True)
     else:
@@ -344,11 +351,7 @@ col_pen, col_table = st.columns([1, 2])
 
 with col_pen:
     st.subheader("Penalties")
-    rounds_with_penalty = 0
-    for _, row in df.iterrows():
-        has_pen = any(row.get(f"h{h['num']}_penalty") == "Y" for h in HOLES)
-        if has_pen:
-            rounds_with_penalty += 1
+    rounds_with_penalty = int(pen_mat.any(axis=1).sum())
     rounds_clean = total_rounds - rounds_with_penalty
 
     fig_pen = go.Figure(data=[go.Pie(
@@ -372,8 +375,7 @@ with col_pen:
 # ---------------------------------------------------------------------------
 with col_table:
     st.subheader("Recent Rounds")
-    display = df.copy().sort_values("date", ascending=False).head(10)
-    display["date"] = display["date"].dt.strftime("%b %d, %Y")
+    recent = df.nlargest(10, "date")
 
     show_cols = ["date"]
     rename = {"date": "Date", "total_score": "Total", "vs_par": "+/-"}
@@ -385,33 +387,22 @@ with col_table:
     show_cols += ["total_score", "vs_par"]
 
     # Add fairway/GIR/UD summary
-    def _round_summary(row):
-        parts = []
-        # Fairway
-        fw = sum(1 for c in ["h1_fairway", "h3_fairway"]
-                 if row.get(c) == "Y")
-        parts.append(f"FW {fw}/2")
-        # GIR
-        gir = sum(1 for h in HOLES if row.get(f"h{h['num']}_gir") == "Y")
-        parts.append(f"GIR {gir}/3")
-        # Up/down
-        udc = sum(1 for h in HOLES if row.get(f"h{h['num']}_ud_chance") == "Y")
-        udy = sum(1 for h in HOLES
-                  if row.get(f"h{h['num']}_ud_chance") == "Y"
-                  and row.get(f"h{h['num']}_ud_convert") == "Y")
-        if udc > 0:
-            parts.append(f"UD {udy}/{udc}")
-        # Penalties
-        pen = sum(1 for h in HOLES if row.get(f"h{h['num']}_penalty") == "Y")
-        if pen > 0:
-            parts.append(f"PEN {pen}")
-        return " | ".join(parts)
-
-    display["Stats"] = display.apply(_round_summary, axis=1)
-    show_cols.append("Stats")
-
-    display = display[show_cols].rename(columns=rename)
-    sorted_display = display.sort_values("Date", ascending=False) if "Date" in display.columns else display
+    fw = _yes(recent, "h1_fairway").astype(int) + _yes(recent, "h3_fairway").astype(int)
+    gir = sum(_yes(recent, f"h{h['num']}_gir").astype(int) for h in HOLES)
+    udc = sum(_yes(recent, f"h{h['num']}_ud_chance").astype(int) for h in HOLES)
+    udy = sum(
+        (_yes(recent, f"h{h['num']}_ud_chance") &
+         _yes(recent, f"h{h['num']}_ud_convert")).astype(int) for h in HOLES
+    )
+    pen = sum(_yes(recent, f"h{h['num']}_penalty").astype(int) for h in HOLES)
+    stats = "FW " + fw.astype(str) + "/2 | GIR " + gir.astype(str) + "/3"
+    stats += (" | UD " + udy.astype(str) + "/" + udc.astype(str)).where(udc > 0, "")
+    stats += (" | PEN " + pen.astype(str)).where(pen > 0, "")
+
+    # Copy only the 10-row slice of displayed columns, newest first
+    display = recent[show_cols].copy()
+    display["Stats"] = stats
+    sorted_display = display.rename(columns=rename)
     original_indices = sorted_display.index.tolist()
     sorted_display = sorted_display.reset_index(drop=True)
 
@@ -419,6 +410,7 @@ with col_table:
         sorted_display,
         use_container_width=True,
         hide_index=True,
+        column_config={"Date": st.column_config.DateColumn(format="MMM DD, YYYY")},
         on_select="rerun",
         selection_mode="single-row",
         key="loop_table",
@@ -427,7 +419,8 @@ with col_table:
     if event.selection.rows:
         sel_pos = event.selection.rows[0]
         orig_idx = original_indices[sel_pos]
-        row_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else ""
+        sel_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else None
+        row_date = sel_date.strftime("%b %d, %Y") if pd.notna(sel_date) else ""
         if st.button(
             f"🗑️  Delete selected round ({row_date})",
             key="loop_delete_btn",
@@ -7,12 +7,14 @@ import sys
 from datetime import date
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from utils.chart_style import LEGEND_TOP, TRANSPARENT_LAYOUT
 from utils.data_manager import delete_csv_row, load_wedge_ladder, save_wedge_ladder_session
 
 st.set_page_config(page_title="Wedge Ladder", page_icon="🪜", layout="wide")
@@ -31,6 +33,8 @@ GRADES = [
     (5, "70% of shots within 2 yards"),
 ]
 
+_THRESHOLDS = np.array([5, 4, 3, 2])  # yards, loosest first
+
 
 def calculate_grade(targets, actuals):
     """Return the highest grade achieved and per-threshold stats."""
@@ -38,12 +42,13 @@ def calculate_grade(targets, actuals):
     if n == 0:
         return 0, {}
 
-    diffs = [abs(t - a) for t, a in zip(targets, actuals)]
+    diffs = np.abs(np.asarray(targets) - np.asarray(actuals))
+    # One broadcast compare: shots within each threshold, in _THRESHOLDS order
+    within = (diffs[:, None] <= _THRESHOLDS).sum(axis=0)
     stats = {}
-    for threshold in (5, 4, 3, 2):
-        within = sum(1 for d in diffs if d <= threshold)
-        pct = within / n * 100
-        stats[threshold] = {"within": within, "total": n, "pct": round(pct, 1)}
+    for threshold, count in zip(_THRESHOLDS.tolist(), within.tolist()):
+        pct = count / n * 100
+        stats[threshold] = {"within": count, "total": n, "pct": round(pct, 1)}
 
     grade = 0
     if stats[5]["pct"] >= 50:
@@ -106,9 +111,9 @@ if not st.session_state.wl_active:
 
         if st.button("Start Drill", type="primary"):
             if mode == "Randomizer":
-                shuffled = distances_ordered.copy()
-                random.shuffle(shuffled)
-                st.session_state.wl_distances = shuffled
+                st.session_state.wl_distances = random.sample(
+                    distances_ordered, len(distances_ordered)
+                )
             else:
                 st.session_state.wl_distances = distances_ordered
             st.session_state.wl_mode = mode
@@ -121,26 +126,38 @@ if not st.session_state.wl_active:
 # Active drill
 # ---------------------------------------------------------------------------
 else:
-    distances = st.session_state.wl_distances
-    mode = st.session_state.wl_mode
+    ss = st.session_state
+    distances = ss.wl_distances
+    mode = ss.wl_mode
+    start, end = ss.wl_start, ss.wl_end
 
     st.subheader(f"Wedge Ladder — {mode}")
-    st.caption(f"{st.session_state.wl_start}–{st.session_state.wl_end} yards  |  "
+    st.caption(f"{start}–{end} yards  |  "
                f"{len(distances)} shots  |  "
                f"{'🔀 Random' if mode == 'Randomizer' else '📶 Ascending'}")
 
     with st.form("wedge_ladder_form"):
-        actuals = []
-        for i, target in enumerate(distances):
-            val = st.number_input(
-                f"Shot {i + 1}  —  Target: **{target} yards**",
-                min_value=0,
-                max_value=300,
-                value=target,
-                step=1,
-                key=f"wl_shot_{i}",
-            )
-            actuals.append(val)
+        # One editable grid instead of a number_input per shot
+        shots_df = pd.DataFrame({
+            "Shot": range(1, len(distances) + 1),
+            "Target": distances,
+            "Actual": distances,
+        })
+        edited = st.data_editor(
+            shots_df,
+            column_config={
+                "Shot": st.column_config.NumberColumn(disabled=True),
+                "Target": st.column_config.NumberColumn("Target (yds)", disabled=True),
+                "Actual": st.column_config.NumberColumn(
+                    "Actual (yds)", min_value=0, max_value=300, step=1, required=True,
+                ),
+            },
+            hide_index=True,
+            num_rows="fixed",
+            use_container_width=True,
+            key="wl_shots",
+        )
+        actuals = edited["Actual"].fillna(0).astype(int).tolist()
 
         col_submit, col_cancel = st.columns([1, 1])
         with col_submit:
@@ -149,7 +166,7 @@ else:
             cancelled = st.form_submit_button("Cancel Drill")
 
     if cancelled:
-        st.session_state.wl_active = False
+        ss.wl_active = False
         st.rerun()
 
     if submitted:
@@ -173,35 +190,35 @@ else:
             mcol3.metric("Within 3 yds", f"{stats[3]['pct']}%", f"{stats[3]['within']}/{stats[3]['total']}")
             mcol4.metric("Within 2 yds", f"{stats[2]['pct']}%", f"{stats[2]['within']}/{stats[2]['total']}")
 
-            # Shot-by-shot results table
-            results_data = []
-            for i, (t, a) in enumerate(zip(distances, actuals)):
-                diff = a - t
-                abs_diff = abs(diff)
-                direction = "short" if diff < 0 else ("long" if diff > 0 else "perfect")
-                results_data.append({
-                    "Shot": i + 1,
-                    "Target": f"{t} yds",
-                    "Actual": f"{a} yds",
-                    "Diff": f"{'+' if diff > 0 else ''}{diff} yds",
-                    "Result": "✅" if abs_diff <= 5 else "❌",
-                })
+            # Shot-by-shot results table, built column-wise
+            t = pd.Series(distances)
+            a = pd.Series(actuals)
+            diff = a - t
+            on_target = diff.abs().to_numpy() <= 5
+            results = pd.DataFrame({
+                "Shot": np.arange(1, len(t) + 1),
+                "Target": t.astype(str) + " yds",
+                "Actual": a.astype(str) + " yds",
+                "Diff": np.where(diff > 0, "+", "") + diff.astype(str) + " yds",
+                "Result": np.where(on_target, "✅", "❌"),
+            })
             st.dataframe(
-                pd.DataFrame(results_data),
+                results,
                 use_container_width=True,
                 hide_index=True,
             )
 
             # Scatter chart: target vs actual
             fig = go.Figure()
-            min_d = min(distances) - 10
-            max_d = max(distances) + 10
+            # Targets are every 5 yds from start to end, so the bounds are known
+            min_d = start - 10
+            max_d = end + 10
             fig.add_trace(go.Scatter(
                 x=[min_d, max_d], y=[min_d, max_d],
                 mode="lines", line=dict(color="white", width=1, dash="dash"),
                 name="Perfect", showlegend=False,
             ))
-            colors = ["#66bb6a" if abs(a - t) <= 5 else "#f44336" for t, a in zip(distances, actuals)]
+            colors = np.where(on_target, "#66bb6a", "#f44336").tolist()
             fig.add_trace(go.Scatter(
                 x=distances, y=actuals,
                 mode="markers",
@@ -213,9 +230,7 @@ else:
                 xaxis_title="Target (yards)",
                 yaxis_title="Actual (yards)",
                 height=350,
-                margin=dict(l=40, r=20, t=20, b=40),
-                paper_bgcolor="rgba(0,0,0,0)",
-                plot_bgcolor="rgba(0,0,0,0)",
+                **TRANSPARENT_LAYOUT,
             )
             st.plotly_chart(fig, use_container_width=True)
 
@@ -223,8 +238,8 @@ else:
             row = {
                 "date": date.today().strftime("%Y-%m-%d"),
                 "mode": mode.lower().replace(" ", "_"),
-                "start_distance": st.session_state.wl_start,
-                "end_distance": st.session_state.wl_end,
+                "start_distance": start,
+                "end_distance": end,
                 "total_shots": len(distances),
                 "grade": grade,
                 "pct_within_5": stats[5]["pct"],
@@ -236,7 +251,7 @@ else:
             st.success("Session saved!")
 
             if st.button("Start New Drill", type="primary"):
-                st.session_state.wl_active = False
+                ss.wl_active = False
                 st.rerun()
 
 # ---------------------------------------------------------------------------
@@ -256,7 +271,7 @@ if not hist_df.empty:
 
     # Grade trend chart
     if len(hist_df) >= 2 and "grade" in hist_df.columns and "date" in hist_df.columns:
-        trend_df = hist_df.sort_values("date")
+        trend_df = hist_df  # already sorted oldest-first by the loader
         fig_trend = go.Figure()
         fig_trend.add_trace(go.Scatter(
             x=trend_df["date"], y=trend_df["grade"],
@@ -267,9 +282,9 @@ if not hist_df.empty:
             hovertemplate="Date: %{x|%b %d}<br>Grade: %{y}<extra></extra>",
         ))
         if len(trend_df) >= 3:
-            trend_df["grade_ma"] = trend_df["grade"].rolling(window=3, min_periods=1).mean()
+            grade_ma = trend_df["grade"].rolling(window=3, min_periods=1).mean()
             fig_trend.add_trace(go.Scatter(
-                x=trend_df["date"], y=trend_df["grade_ma"],
+                x=trend_df["date"], y=grade_ma,
                 mode="lines",
                 line=dict(color="#ffffff", width=3),
                 name="3-Session Avg",
@@ -279,17 +294,12 @@ if not hist_df.empty:
             xaxis_title="Date",
             yaxis=dict(range=[0, 5.5], dtick=1),
             height=300,
-            margin=dict(l=40, r=20, t=20, b=40),
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)",
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+            **TRANSPARENT_LAYOUT,
+            legend=LEGEND_TOP,
         )
         st.plotly_chart(fig_trend, use_container_width=True)
 
-    # History table with delete
-    display = hist_df.copy()
-    if "date" in display.columns:
-        display["date"] = pd.to_datetime(display["date"]).dt.strftime("%b %d, %Y")
+    # History table with delete (dates stay datetime; the column config formats them)
     col_map = {
         "date": "Date",
         "mode": "Mode",
@@ -302,9 +312,9 @@ if not hist_df.empty:
         "pct_within_3": "≤3 yds %",
         "pct_within_2": "≤2 yds %",
     }
-    display = display.rename(columns=col_map)
+    display = hist_df.rename(columns=col_map)
 
-    sorted_display = display.sort_values("Date", ascending=False) if "Date" in display.columns else display
+    sorted_display = display.iloc[::-1]  # newest first
     original_indices = sorted_display.index.tolist()
     sorted_display = sorted_display.reset_index(drop=True)
 
@@ -312,6 +322,7 @@ if not hist_df.empty:
         sorted_display,
         use_container_width=True,
         hide_index=True,
+        column_config={"Date": st.column_config.DateColumn(format="MMM DD, YYYY")},
         on_select="rerun",
         selection_mode="single-row",
         key="wl_history_table",
@@ -320,7 +331,8 @@ if not hist_df.empty:
     if event.selection.rows:
         sel_pos = event.selection.rows[0]
         orig_idx = original_indices[sel_pos]
-        row_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else ""
+        sel_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else None
+        row_date = sel_date.strftime("%b %d, %Y") if pd.notna(sel_date) else ""
         if st.button(
             f"🗑️  Delete selected session ({row_date})",
             key="wl_delete_btn",
@@ -2,10 +2,11 @@
 Putting Testing — structured putting tests with history tracking.
 """
 
-import random
 import sys
+from bisect import bisect_right
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 import numpy as np
 import pandas as pd
@@ -14,7 +15,13 @@ import streamlit as st
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from utils.data_manager import delete_csv_row, load_putting_testing, save_putting_testing_session
+from utils.chart_style import LEGEND_TOP, TRANSPARENT_LAYOUT
+from utils.data_manager import (
+    data_version,
+    delete_csv_row,
+    load_putting_testing,
+    save_putting_testing_session,
+)
 
 st.set_page_config(page_title="Putting Testing", page_icon="🏌️", layout="wide")
 
@@ -32,10 +39,19 @@ LAG_FIELDS = [
     for v in LAG_VERSIONS
 ]
 
+# History table column labels
+HISTORY_COL_MAP = {
+    "date": "Date",
+    "test_type": "Test",
+    "score": "Score",
+    "putting_hcp": "Putting HCP",
+    **{col: label for label, col in LAG_FIELDS},
+}
+
 # ---------------------------------------------------------------------------
 # Swedish Drill constants
 # ---------------------------------------------------------------------------
-SWEDISH_PUTT_DISTANCES = [22, 12, 18, 10, 14, 8] * 3  # 18 putts, each distance 3x
+SWEDISH_PUTT_DISTANCES = np.array([22, 12, 18, 10, 14, 8] * 3, dtype=np.uint8)  # 18 putts, each distance 3x
 
 SWEDISH_BENCHMARKS = [
     (-5.5, "Tour Player"),
@@ -47,40 +63,142 @@ SWEDISH_BENCHMARKS = [
     (+10.7, "10 HCP"),
 ]
 
+_SW_BM_SCORES = np.array([bm for bm, _ in SWEDISH_BENCHMARKS])
+_SW_BM_LABELS = np.array([label for _, label in SWEDISH_BENCHMARKS])
+
 # Interpolation data: test score → putting handicap
 _SW_SCORES = [0.2, 2.0, 6.3, 10.7]
 _SW_HCAPS = [-2, 0, 5, 10]
+_SW_SLOPES = [
+    (h1 - h0) / (s1 - s0)
+    for s0, s1, h0, h1 in zip(_SW_SCORES, _SW_SCORES[1:], _SW_HCAPS, _SW_HCAPS[1:])
+]
+
+
+# Per-putt scoring: upper bound (meters from hole, inclusive) -> score.
+# Holed (0) is Eagle, <=0.5 Birdie, <=1 Par, <=2 Bogey, <=3 Double, else Triple.
+_SW_EDGES = np.array([0.0, 0.5, 1.0, 2.0, 3.0])
+_SW_VALUES = np.array([-2, -1, 0, 1, 2, 3])
 
 
-def swedish_putt_score(dist_from_hole: float) -> int:
-    """Score a single putt based on distance from hole (meters)."""
-    if dist_from_hole == 0:
-        return -2  # Eagle (holed)
-    if dist_from_hole <= 0.5:
-        return -1  # Birdie
-    if dist_from_hole <= 1.0:
-        return 0   # Par
-    if dist_from_hole <= 2.0:
-        return 1   # Bogey
-    if dist_from_hole <= 3.0:
-        return 2   # Double Bogey
-    return 3        # Triple Bogey
+def swedish_putt_scores(dists_from_hole) -> np.ndarray:
+    """Score every putt at once from its distance from the hole (meters)."""
+    idx = np.searchsorted(_SW_EDGES, np.asarray(dists_from_hole, dtype=float), side="left")
+    return _SW_VALUES[idx]
 
 
-def swedish_score_label(score: int) -> str:
-    labels = {-2: "Eagle", -1: "Birdie", 0: "Par", 1: "Bogey", 2: "Double", 3: "Triple"}
-    return labels.get(score, str(score))
+SWEDISH_SCORE_LABELS = {-2: "Eagle", -1: "Birdie", 0: "Par", 1: "Bogey", 2: "Double", 3: "Triple"}
 
 
 def swedish_putting_handicap(total_score: float) -> float:
-    """Interpolate a putting handicap from the total test score."""
-    return float(np.interp(total_score, _SW_SCORES, _SW_HCAPS))
+    """Interpolate a putting handicap from the total test score, clamped to
+    the table's ends (same result as np.interp, without the array setup)."""
+    if total_score <= _SW_SCORES[0]:
+        return float(_SW_HCAPS[0])
+    if total_score >= _SW_SCORES[-1]:
+        return float(_SW_HCAPS[-1])
+    i = bisect_right(_SW_SCORES, total_score) - 1
+    return _SW_HCAPS[i] + _SW_SLOPES[i] * (total_score - _SW_SCORES[i])
 
 
 def swedish_level_label(total_score: float) -> str:
     """Return the closest benchmark level label."""
-    closest = min(SWEDISH_BENCHMARKS, key=lambda b: abs(b[0] - total_score))
-    return closest[1]
+    return str(_SW_BM_LABELS[int(np.argmin(np.abs(_SW_BM_SCORES - total_score)))])
+
+
+def _trailing_mean(values, window: int) -> np.ndarray:
+    """Mean of the last ``window`` non-NaN values at each point (partial
+    windows at the start), via cumulative sums -- same result as
+    ``rolling(window, min_periods=1).mean()``."""
+    vals = np.asarray(values, dtype=np.float64)
+    ok = ~np.isnan(vals)
+    sums = np.concatenate(([0.0], np.cumsum(np.where(ok, vals, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(ok)))
+    lo = np.maximum(np.arange(1, len(vals) + 1) - window, 0)
+    n = counts[1:] - counts[lo]
+    return np.divide(sums[1:] - sums[lo], n, out=np.full(len(vals), np.nan), where=n > 0)
+
+
+@st.cache_data(show_spinner=False)
+def build_test_view(_hist_df: pd.DataFrame, selected_test: str, hist_version: tuple):
+    """Return ``(trend, display)`` for one test type: ``trend`` is its
+    sessions oldest-first with a 3-session ``score_ma``; ``display`` is the
+    history table, newest-first with display labels (dates stay datetime
+    and are formatted by the table's column config).
+    Both keep the worksheet row numbers as the index (used for delete).
+    ``_hist_df`` isn't hashed; the cache is keyed on ``selected_test`` and
+    ``hist_version`` (``data_version`` of the frame)."""
+    hist_df = _hist_df
+    if "test_type" in hist_df.columns:
+        trend = hist_df[hist_df["test_type"] == selected_test]
+    else:
+        trend = hist_df
+    if "date" in trend.columns:
+        trend = trend.sort_values("date", kind="stable")
+    trend = trend.assign(score_ma=_trailing_mean(trend["score"], 3))
+
+    display = trend.drop(columns="score_ma").iloc[::-1]
+
+    display = display.rename(columns=HISTORY_COL_MAP)
+    # Drop internal columns from display
+    drop_cols = ["Test"]
+    if selected_test == "Luke Donald Drill":
+        drop_cols += [c for c in display.columns if c.startswith("ld_h")]
+    display = display.drop(columns=[c for c in drop_cols if c in display.columns])
+    return trend, display
+
+
+# Cached on the plotted values and style, so widget reruns that leave the
+# selected test's history unchanged skip the figure build.
+@st.cache_data(show_spinner=False)
+def _trend_figure(
+    dates: tuple,
+    scores: tuple,
+    score_ma: tuple,
+    *,
+    name: str = "Score",
+    yaxis_title: str = "Score",
+    height: int = 300,
+    right_margin: int = 20,
+    yrange: Optional[tuple] = None,
+    hovertemplate: Optional[str] = None,
+    hlines: tuple = (),
+) -> go.Figure:
+    """Score trend with, from 3 sessions on, its 3-session moving average.
+    ``hlines`` holds ``(y, label, dash, color)`` reference lines. Traces are
+    WebGL (Scattergl) so long histories don't cost one SVG node per point."""
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=dates, y=scores,
+        mode="lines+markers",
+        line=dict(color="#66bb6a", width=2),
+        marker=dict(size=8),
+        name=name,
+        hovertemplate=hovertemplate,
+    ))
+    if len(scores) >= 3:
+        fig.add_trace(go.Scattergl(
+            x=dates, y=score_ma,
+            mode="lines",
+            line=dict(color="#ffffff", width=3),
+            name="3-Session Avg",
+        ))
+    for y, label, dash, color in hlines:
+        fig.add_hline(
+            y=y, line_dash=dash, line_color=color,
+            annotation_text=label, annotation_position="right",
+        )
+    fig.update_layout(
+        yaxis_title=yaxis_title,
+        xaxis_title="Date",
+        height=height,
+        **TRANSPARENT_LAYOUT,
+        legend=LEGEND_TOP,
+    )
+    fig.update_layout(margin_r=right_margin)
+    if yrange is not None:
+        fig.update_yaxes(range=list(yrange))
+    return fig
 
 
 # ---------------------------------------------------------------------------
@@ -89,6 +207,34 @@ def swedish_level_label(total_score: float) -> str:
 LUKE_DONALD_DISTANCES = [4, 5, 6, 7, 8]
 LUKE_DONALD_HOLES = [1, 2, 3, 4]
 LUKE_DONALD_GOAL = 15  # out of 20
+# Make-flag columns, hole-major so a (sessions, holes, distances) reshape lines up
+LUKE_DONALD_COLS = [f"ld_h{h}_{d}ft" for h in LUKE_DONALD_HOLES for d in LUKE_DONALD_DISTANCES]
+
+# Static charts: no mode bar, no transition animation between reruns
+_CHART_CONFIG = {"displayModeBar": False}
+_NO_TRANSITION = {"duration": 0}
+
+# Per-test trend chart options for _trend_figure (other tests use the defaults)
+TREND_STYLES = {
+    "Swedish Drill": dict(
+        yaxis_title="Total Score",
+        height=400,
+        right_margin=100,
+        hlines=tuple(
+            (bm_score, bm_label, "dot", "rgba(255,255,255,0.2)")
+            for bm_score, bm_label in SWEDISH_BENCHMARKS
+            if -8 <= bm_score <= 15
+        ),
+    ),
+    "Luke Donald Drill": dict(
+        name="Makes",
+        yaxis_title="Makes (out of 20)",
+        right_margin=80,
+        yrange=(0, 21),
+        hovertemplate="Date: %{x|%b %d}<br>Makes: %{y}/20<extra></extra>",
+        hlines=((LUKE_DONALD_GOAL, f"Goal: {LUKE_DONALD_GOAL}/20", "dash", "#ffa726"),),
+    ),
+}
 
 TEST_NAMES = ["Lag Drill", "Swedish Drill", "Luke Donald Drill", "Stack Putting Session"]
 
@@ -106,27 +252,26 @@ if selected_test == "Lag Drill":
     with st.form("lag_drill_form", clear_on_submit=True):
         lag_date = st.date_input("Date", value=date.today(), key="lag_date")
 
-        scores = {}
-        for d in LAG_DISTANCES:
-            cols = st.columns(2)
-            for i, v in enumerate(LAG_VERSIONS):
-                field_key = f"lag_{d}_{v.lower()}"
-                label = f"{d}ft {v}"
-                with cols[i]:
-                    scores[field_key] = st.number_input(
-                        label,
-                        min_value=0,
-                        max_value=5,
-                        value=0,
-                        step=1,
-                        key=field_key,
-                        help="Putts in the box (out of 5)",
-                    )
+        # One column per version; LAG_FIELDS is distance-major, so each
+        # column stacks its version's inputs in distance order
+        cols = st.columns(len(LAG_VERSIONS))
+        scores = {
+            field_key: cols[i % len(LAG_VERSIONS)].number_input(
+                label,
+                min_value=0,
+                max_value=5,
+                value=0,
+                step=1,
+                key=field_key,
+                help="Putts in the box (out of 5)",
+            )
+            for i, (label, field_key) in enumerate(LAG_FIELDS)
+        }
 
         submitted = st.form_submit_button("Submit Lag Drill", type="primary")
 
     if submitted:
-        total = sum(scores.values())
+        total = int(np.fromiter(scores.values(), dtype=np.int8, count=len(LAG_FIELDS)).sum())
         if total > 0:
             row = {"date": lag_date.strftime("%Y-%m-%d"), "test_type": "Lag Drill"}
             row.update(scores)
@@ -182,9 +327,7 @@ elif selected_test == "Swedish Drill":
     if not st.session_state.sw_active:
         st.info(f"**18 putts** at distances from 8m to 22m, presented in random order.")
         if st.button("Start Swedish Drill", type="primary"):
-            order = SWEDISH_PUTT_DISTANCES.copy()
-            random.shuffle(order)
-            st.session_state.sw_order = order
+            st.session_state.sw_order = np.random.default_rng().permutation(SWEDISH_PUTT_DISTANCES)
             st.session_state.sw_active = True
             st.rerun()
     else:
@@ -193,18 +336,27 @@ elif selected_test == "Swedish Drill":
         with st.form("swedish_drill_form"):
             sw_date = st.date_input("Date", value=date.today(), key="sw_date")
 
-            distances_entered = []
-            for i, target_m in enumerate(order):
-                val = st.number_input(
-                    f"Putt {i + 1}  —  Distance: **{target_m}m**  →  Result (m from hole)",
-                    min_value=0.0,
-                    max_value=20.0,
-                    value=1.0,
-                    step=0.1,
-                    format="%.1f",
-                    key=f"sw_putt_{i}",
-                )
-                distances_entered.append(val)
+            # One editable grid instead of a number_input per putt
+            putts_df = pd.DataFrame({
+                "Putt": np.arange(1, len(order) + 1),
+                "Distance (m)": order,
+                "From Hole (m)": 1.0,
+            })
+            edited = st.data_editor(
+                putts_df,
+                column_config={
+                    "Putt": st.column_config.NumberColumn(disabled=True),
+                    "Distance (m)": st.column_config.NumberColumn(disabled=True),
+                    "From Hole (m)": st.column_config.NumberColumn(
+                        min_value=0.0, max_value=20.0, step=0.1, format="%.1f", required=True,
+                    ),
+                },
+                hide_index=True,
+                num_rows="fixed",
+                use_container_width=True,
+                key="sw_putts",
+            )
+            distances_entered = edited["From Hole (m)"].fillna(1.0).to_numpy(dtype=float)
 
             col_sub, col_cancel = st.columns(2)
             with col_sub:
@@ -218,8 +370,8 @@ elif selected_test == "Swedish Drill":
 
         if submitted:
             # Calculate scores
-            putt_scores = [swedish_putt_score(d) for d in distances_entered]
-            total_score = sum(putt_scores)
+            putt_scores = swedish_putt_scores(distances_entered)
+            total_score = int(putt_scores.sum())
             putting_hcp = swedish_putting_handicap(total_score)
             level = swedish_level_label(total_score)
 
@@ -233,18 +385,16 @@ elif selected_test == "Swedish Drill":
             m2.metric("Putting Handicap", f"{putting_hcp:+.1f}")
             m3.metric("Level", level)
 
-            # Shot-by-shot results
-            results = []
-            for i, (target, dist, sc) in enumerate(zip(order, distances_entered, putt_scores)):
-                sign_s = "+" if sc > 0 else ""
-                results.append({
-                    "Putt": i + 1,
-                    "Distance": f"{target}m",
-                    "From Hole": f"{dist:.1f}m",
-                    "Score": f"{sign_s}{sc}",
-                    "Result": swedish_score_label(sc),
-                })
-            st.dataframe(pd.DataFrame(results), use_container_width=True, hide_index=True)
+            # Shot-by-shot results, built column-wise
+            scores_s = pd.Series(putt_scores)
+            results = pd.DataFrame({
+                "Putt": np.arange(1, len(order) + 1),
+                "Distance": pd.Series(order).astype(str) + "m",
+                "From Hole": np.char.mod("%.1fm", distances_entered),
+                "Score": np.where(scores_s > 0, "+", "") + scores_s.astype(str),
+                "Result": scores_s.map(SWEDISH_SCORE_LABELS),
+            })
+            st.dataframe(results, use_container_width=True, hide_index=True)
 
             # Save
             row = {
@@ -308,245 +458,146 @@ elif selected_test == "Luke Donald Drill":
 # ---------------------------------------------------------------------------
 # Session History (filtered by selected test)
 # ---------------------------------------------------------------------------
-st.markdown("---")
-st.subheader("Session History")
-
-hist_df = load_putting_testing()
-if not hist_df.empty:
-    if "test_type" in hist_df.columns:
-        filtered = hist_df[hist_df["test_type"] == selected_test].copy()
-    else:
-        filtered = hist_df.copy()
-
-    if not filtered.empty:
-        filtered["score"] = pd.to_numeric(filtered["score"], errors="coerce")
-
-        # Summary metrics — adapt labels per test type
-        if selected_test == "Lag Drill":
-            mcol1, mcol2, mcol3 = st.columns(3)
-            mcol1.metric("Total Sessions", len(filtered))
-            mcol2.metric("Best Score", f"{int(filtered['score'].max())}/30")
-            mcol3.metric("Avg Score", f"{filtered['score'].mean():.1f}/30")
-        elif selected_test == "Swedish Drill":
-            mcol1, mcol2, mcol3, mcol4 = st.columns(4)
-            mcol1.metric("Total Sessions", len(filtered))
-            best = filtered["score"].min()
-            sign = "+" if best > 0 else ""
-            mcol2.metric("Best Score", f"{sign}{int(best)}")
-            avg = filtered["score"].mean()
-            sign = "+" if avg > 0 else ""
-            mcol3.metric("Avg Score", f"{sign}{avg:.1f}")
-            if "putting_hcp" in filtered.columns:
-                latest_hcp = pd.to_numeric(filtered["putting_hcp"], errors="coerce").iloc[-1]
-                mcol4.metric("Latest HCP", f"{latest_hcp:+.1f}")
-        elif selected_test == "Luke Donald Drill":
-            mcol1, mcol2, mcol3, mcol4 = st.columns(4)
-            mcol1.metric("Total Sessions", len(filtered))
-            mcol2.metric("Best Score", f"{int(filtered['score'].max())}/20")
-            mcol3.metric("Avg Score", f"{filtered['score'].mean():.1f}/20")
-            goal_met = (filtered["score"] >= LUKE_DONALD_GOAL).sum()
-            mcol4.metric("Goal Hit", f"{goal_met}/{len(filtered)}")
-        else:
-            mcol1, mcol2 = st.columns(2)
-            mcol1.metric("Total Sessions", len(filtered))
-            mcol2.metric("Best Score", int(filtered["score"].max()))
-
-        # Trend chart
-        if len(filtered) >= 2 and "date" in filtered.columns:
-            trend = filtered.sort_values("date")
-
-            if selected_test == "Swedish Drill":
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=trend["date"], y=trend["score"],
-                    mode="lines+markers",
-                    line=dict(color="#66bb6a", width=2),
-                    marker=dict(size=8),
-                    name="Score",
-                ))
-                if len(trend) >= 3:
-                    trend["score_ma"] = trend["score"].rolling(window=3, min_periods=1).mean()
-                    fig.add_trace(go.Scatter(
-                        x=trend["date"], y=trend["score_ma"],
-                        mode="lines",
-                        line=dict(color="#ffffff", width=3),
-                        name="3-Session Avg",
-                    ))
-                # Benchmark lines
-                for bm_score, bm_label in SWEDISH_BENCHMARKS:
-                    if -8 <= bm_score <= 15:
-                        fig.add_hline(
-                            y=bm_score,
-                            line_dash="dot",
-                            line_color="rgba(255,255,255,0.2)",
-                            annotation_text=bm_label,
-                            annotation_position="right",
-                        )
-                fig.update_layout(
-                    yaxis_title="Total Score",
-                    xaxis_title="Date",
-                    height=400,
-                    margin=dict(l=40, r=100, t=20, b=40),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                )
-                st.plotly_chart(fig, use_container_width=True)
+# Runs as a fragment: selecting a row in the history table reruns only
+# this panel, not the test forms above it.
+@st.fragment
+def _render_history(selected_test: str) -> None:
+    st.markdown("---")
+    st.subheader("Session History")
+
+    hist_df = load_putting_testing()
+    if not hist_df.empty:
+        # Filtered, sorted and formatted once per (history, test) via the cache
+        filtered, display = build_test_view(hist_df, selected_test, data_version(hist_df))
+
+        if not filtered.empty:
+            # Summary metrics — adapt labels per test type
+            if selected_test == "Lag Drill":
+                mcol1, mcol2, mcol3 = st.columns(3)
+                mcol1.metric("Total Sessions", len(filtered))
+                mcol2.metric("Best Score", f"{int(filtered['score'].max())}/30")
+                mcol3.metric("Avg Score", f"{filtered['score'].mean():.1f}/30")
+            elif selected_test == "Swedish Drill":
+                mcol1, mcol2, mcol3, mcol4 = st.columns(4)
+                mcol1.metric("Total Sessions", len(filtered))
+                best = filtered["score"].min()
+                sign = "+" if best > 0 else ""
+                mcol2.metric("Best Score", f"{sign}{int(best)}")
+                avg = filtered["score"].mean()
+                sign = "+" if avg > 0 else ""
+                mcol3.metric("Avg Score", f"{sign}{avg:.1f}")
+                if "putting_hcp" in filtered.columns:
+                    latest_hcp = filtered["putting_hcp"].iloc[-1]
+                    mcol4.metric("Latest HCP", f"{latest_hcp:+.1f}")
             elif selected_test == "Luke Donald Drill":
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=trend["date"], y=trend["score"],
-                    mode="lines+markers",
-                    line=dict(color="#66bb6a", width=2),
-                    marker=dict(size=8),
-                    name="Makes",
-                    hovertemplate="Date: %{x|%b %d}<br>Makes: %{y}/20<extra></extra>",
-                ))
-                if len(trend) >= 3:
-                    trend["score_ma"] = trend["score"].rolling(window=3, min_periods=1).mean()
-                    fig.add_trace(go.Scatter(
-                        x=trend["date"], y=trend["score_ma"],
-                        mode="lines",
-                        line=dict(color="#ffffff", width=3),
-                        name="3-Session Avg",
-                    ))
-                fig.add_hline(
-                    y=LUKE_DONALD_GOAL, line_dash="dash", line_color="#ffa726",
-                    annotation_text=f"Goal: {LUKE_DONALD_GOAL}/20",
-                    annotation_position="right",
-                )
-                fig.update_layout(
-                    yaxis_title="Makes (out of 20)",
-                    xaxis_title="Date",
-                    yaxis=dict(range=[0, 21]),
-                    height=300,
-                    margin=dict(l=40, r=80, t=20, b=40),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-                )
-                st.plotly_chart(fig, use_container_width=True)
+                mcol1, mcol2, mcol3, mcol4 = st.columns(4)
+                mcol1.metric("Total Sessions", len(filtered))
+                mcol2.metric("Best Score", f"{int(filtered['score'].max())}/20")
+                mcol3.metric("Avg Score", f"{filtered['score'].mean():.1f}/20")
+                goal_met = (filtered["score"] >= LUKE_DONALD_GOAL).sum()
+                mcol4.metric("Goal Hit", f"{goal_met}/{len(filtered)}")
             else:
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=trend["date"], y=trend["score"],
-                    mode="lines+markers",
-                    line=dict(color="#66bb6a", width=2),
-                    marker=dict(size=8),
-                    name="Score",
-                ))
-                if len(trend) >= 3:
-                    trend["score_ma"] = trend["score"].rolling(window=3, min_periods=1).mean()
-                    fig.add_trace(go.Scatter(
-                        x=trend["date"], y=trend["score_ma"],
-                        mode="lines",
-                        line=dict(color="#ffffff", width=3),
-                        name="3-Session Avg",
-                    ))
-                fig.update_layout(
-                    yaxis_title="Score",
-                    xaxis_title="Date",
-                    height=300,
-                    margin=dict(l=40, r=20, t=20, b=40),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
+                mcol1, mcol2 = st.columns(2)
+                mcol1.metric("Total Sessions", len(filtered))
+                mcol2.metric("Best Score", int(filtered["score"].max()))
+
+            # Trend chart
+            if len(filtered) >= 2 and "date" in filtered.columns:
+                trend = filtered  # already date-sorted with score_ma
+
+                fig = _trend_figure(
+                    tuple(trend["date"]), tuple(trend["score"]), tuple(trend["score_ma"]),
+                    **TREND_STYLES.get(selected_test, {}),
                 )
-                st.plotly_chart(fig, use_container_width=True)
-
-        # Distance breakdown (Lag Drill specific)
-        if selected_test == "Lag Drill" and len(filtered) >= 1:
-            lag_cols_present = [c for _, c in LAG_FIELDS if c in filtered.columns]
-            if lag_cols_present:
-                avgs = {}
-                for label, col in LAG_FIELDS:
-                    if col in filtered.columns:
-                        vals = pd.to_numeric(filtered[col], errors="coerce")
-                        avgs[label] = vals.mean()
-                if avgs:
+                # uirevision keeps zoom/pan across reruns of the same test
+                fig.update_layout(uirevision=selected_test, transition=_NO_TRANSITION)
+                st.plotly_chart(fig, use_container_width=True, config=_CHART_CONFIG)
+
+            # Distance breakdown (Lag Drill specific)
+            if selected_test == "Lag Drill" and len(filtered) >= 1:
+                present = [(label, col) for label, col in LAG_FIELDS if col in filtered.columns]
+                if present:
+                    # One column-wise mean over the (already numeric) lag counts
+                    labels = [label for label, _ in present]
+                    means = filtered[[col for _, col in present]].astype("float32").mean().to_numpy()
                     fig_bar = go.Figure(data=[go.Bar(
-                        x=list(avgs.keys()),
-                        y=list(avgs.values()),
+                        x=labels,
+                        y=means,
                         marker_color=["#2e7d32", "#66bb6a"] * 3,
                     )])
                     fig_bar.update_layout(
                         yaxis_title="Avg Putts in Box (out of 5)",
                         yaxis=dict(range=[0, 5.5]),
                         height=280,
-                        margin=dict(l=40, r=20, t=20, b=40),
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        plot_bgcolor="rgba(0,0,0,0)",
+                        **TRANSPARENT_LAYOUT,
                     )
-                    st.plotly_chart(fig_bar, use_container_width=True)
-
-        # Distance make % breakdown (Luke Donald specific)
-        if selected_test == "Luke Donald Drill" and len(filtered) >= 1:
-            dist_pcts = {}
-            for dist in LUKE_DONALD_DISTANCES:
-                cols_for_dist = [f"ld_h{h}_{dist}ft" for h in LUKE_DONALD_HOLES]
-                present = [c for c in cols_for_dist if c in filtered.columns]
-                if present:
-                    vals = filtered[present].apply(pd.to_numeric, errors="coerce")
-                    dist_pcts[f"{dist}ft"] = vals.values.mean() * 100
-            if dist_pcts:
-                fig_bar = go.Figure(data=[go.Bar(
-                    x=list(dist_pcts.keys()),
-                    y=list(dist_pcts.values()),
-                    marker_color=["#2e7d32", "#388e3c", "#43a047", "#4caf50", "#66bb6a"],
-                    text=[f"{v:.0f}%" for v in dist_pcts.values()],
-                    textposition="outside",
-                )])
-                fig_bar.update_layout(
-                    yaxis_title="Make %",
-                    yaxis=dict(range=[0, 105]),
-                    height=280,
-                    margin=dict(l=40, r=20, t=20, b=40),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                )
-                st.plotly_chart(fig_bar, use_container_width=True)
-
-        # History table with delete
-        display = filtered.copy()
-        if "date" in display.columns:
-            display["date"] = pd.to_datetime(display["date"]).dt.strftime("%b %d, %Y")
-
-        col_map = {"date": "Date", "test_type": "Test", "score": "Score", "putting_hcp": "Putting HCP"}
-        for label, col in LAG_FIELDS:
-            col_map[col] = label
-        display = display.rename(columns={k: v for k, v in col_map.items() if k in display.columns})
-        # Drop internal columns from display
-        drop_cols = ["Test"]
-        if selected_test == "Luke Donald Drill":
-            drop_cols += [c for c in display.columns if c.startswith("ld_h")]
-        display = display.drop(columns=[c for c in drop_cols if c in display.columns], errors="ignore")
-
-        sorted_display = display.sort_values("Date", ascending=False) if "Date" in display.columns else display
-        original_indices = sorted_display.index.tolist()
-        sorted_display = sorted_display.reset_index(drop=True)
-
-        event = st.dataframe(
-            sorted_display,
-            use_container_width=True,
-            hide_index=True,
-            on_select="rerun",
-            selection_mode="single-row",
-            key="pt_history_table",
-        )
-
-        if event.selection.rows:
-            sel_pos = event.selection.rows[0]
-            orig_idx = original_indices[sel_pos]
-            row_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else ""
-            if st.button(
-                f"🗑️  Delete selected session ({row_date})",
-                key="pt_delete_btn",
-                type="secondary",
-            ):
-                delete_csv_row("putting_testing", orig_idx)
-                st.success("Session deleted.")
-                st.rerun()
+                    fig_bar.update_layout(uirevision=selected_test, transition=_NO_TRANSITION)
+                    st.plotly_chart(fig_bar, use_container_width=True, config=_CHART_CONFIG)
+
+            # Distance make % breakdown (Luke Donald specific)
+            if selected_test == "Luke Donald Drill" and len(filtered) >= 1:
+                # All 20 flags as one (sessions, holes, distances) array; missing
+                # columns come through as NaN and are skipped like blank cells
+                ld = filtered.reindex(columns=LUKE_DONALD_COLS).to_numpy(dtype=np.float32, na_value=np.nan)
+                ld = ld.reshape(len(filtered), len(LUKE_DONALD_HOLES), len(LUKE_DONALD_DISTANCES))
+                made = np.nansum(ld, axis=(0, 1))
+                logged = np.count_nonzero(~np.isnan(ld), axis=(0, 1))
+                dist_pcts = {
+                    f"{dist}ft": m / n * 100
+                    for dist, m, n in zip(LUKE_DONALD_DISTANCES, made.tolist(), logged.tolist())
+                    if n
+                }
+                if dist_pcts:
+                    fig_bar = go.Figure(data=[go.Bar(
+                        x=list(dist_pcts.keys()),
+                        y=list(dist_pcts.values()),
+                        marker_color=["#2e7d32", "#388e3c", "#43a047", "#4caf50", "#66bb6a"],
+                        text=[f"{v:.0f}%" for v in dist_pcts.values()],
+                        textposition="outside",
+                    )])
+                    fig_bar.update_layout(
+                        yaxis_title="Make %",
+                        yaxis=dict(range=[0, 105]),
+                        height=280,
+                        **TRANSPARENT_LAYOUT,
+                    )
+                    fig_bar.update_layout(uirevision=selected_test, transition=_NO_TRANSITION)
+                    st.plotly_chart(fig_bar, use_container_width=True, config=_CHART_CONFIG)
+
+            # History table with delete (display is already newest-first)
+            original_indices = display.index.tolist()
+            sorted_display = display.reset_index(drop=True)
+
+            event = st.dataframe(
+                sorted_display,
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    "Date": st.column_config.DateColumn(format="MMM DD, YYYY"),
+                    "Score": st.column_config.NumberColumn(format="%d"),
+                },
+                on_select="rerun",
+                selection_mode="single-row",
+                key="pt_history_table",
+            )
+
+            if event.selection.rows:
+                sel_pos = event.selection.rows[0]
+                orig_idx = original_indices[sel_pos]
+                sel_date = sorted_display.loc[sel_pos, "Date"] if "Date" in sorted_display.columns else None
+                row_date = sel_date.strftime("%b %d, %Y") if pd.notna(sel_date) else ""
+                if st.button(
+                    f"🗑️  Delete selected session ({row_date})",
+                    key="pt_delete_btn",
+                    type="secondary",
+                ):
+                    delete_csv_row("putting_testing", orig_idx)
+                    st.success("Session deleted.")
+                    st.rerun()
+        else:
+            st.info(f"No **{selected_test}** sessions yet.")
     else:
-        st.info(f"No **{selected_test}** sessions yet.")
-else:
-    st.info("No putting test sessions yet. Complete a test above to start tracking!")
+        st.info("No putting test sessions yet. Complete a test above to start tracking!")
+
+
+_render_history(selected_test)
@@ -0,0 +1,13 @@
+"""
+Plotly layout pieces shared by the page charts.
+"""
+
+# Transparent background with the standard chart margins
+TRANSPARENT_LAYOUT = dict(
+    margin=dict(l=40, r=20, t=20, b=40),
+    paper_bgcolor="rgba(0,0,0,0)",
+    plot_bgcolor="rgba(0,0,0,0)",
+)
+
+# Horizontal legend above the plot, right-aligned
+LEGEND_TOP = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
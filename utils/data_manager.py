@@ -5,15 +5,28 @@ Static reference data (goals, drills, lookup tables) stays in local JSON files.
 """
 
 import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; falls back to the stdlib json module
+    orjson = None
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 
+_log = logging.getLogger(__name__)
+
 # ---------------------------------------------------------------------------
 # Google Sheets connection
 # ---------------------------------------------------------------------------
@@ -31,32 +44,115 @@ def _get_conn():
 _READ_TTL = 120  # seconds to cache worksheet reads (keeps API usage low)
 
 
+def _clean_worksheet(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Normalize a raw worksheet read: drop blank rows, parse the date column."""
+    if df is None:
+        return pd.DataFrame()
+    # Drop fully-empty rows that gsheets sometimes returns
+    df = df.dropna(how="all")
+    if df.empty:
+        return pd.DataFrame()
+    # Clean date column -- the ISO8601 parser accepts the "2026-02-01 0:00:00"
+    # format from Sheets as-is; normalize drops the time part
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], format="ISO8601", errors="coerce").dt.normalize()
+    return df
+
+
+# Label columns with a small fixed vocabulary, stored as categoricals
+_CATEGORY_COLS = ("test_type", "mode")
+# Y/N flag columns on the three_hole_loop sheet (h1_fairway, h2_gir, ...)
+_LOOP_FLAG_SUFFIXES = ("_fairway", "_gir", "_ud_chance", "_ud_convert", "_penalty")
+
+
+def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink column dtypes for read-only use: integer drill counts go to the
+    smallest int type, the known label columns (test types, modes, Y/N
+    flags) become categoricals. Float columns are left alone so displayed
+    percentages keep their precision."""
+    for col in df.select_dtypes(include="integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        if col in _CATEGORY_COLS or col.endswith(_LOOP_FLAG_SUFFIXES):
+            df[col] = df[col].astype("category")
+    return df
+
+
+# Worksheet name -> time of its last real fetch; lets _map_sheets tell a
+# warm cache_data entry from a cold one (cleared with the read cache)
+_fetched_at: Dict[str, float] = {}
+
+
+def _is_warm(name: str) -> bool:
+    fetched = _fetched_at.get(name)
+    return fetched is not None and time.time() - fetched < _READ_TTL
+
+
+@st.cache_data(ttl=_READ_TTL, show_spinner=False)
+def _read_worksheet_cached(name: str) -> pd.DataFrame:
+    """Read and clean a worksheet, memoized across reruns.
+    Exceptions are not cached, so a failed read is retried next rerun."""
+    conn = _get_conn()
+    df = _downcast(_clean_worksheet(conn.read(worksheet=name, ttl=_READ_TTL)))
+    # Stamp the fetch so derived caches can key on data_version()
+    df.attrs["fetched_at"] = _fetched_at[name] = time.time()
+    return df
+
+
+def data_version(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a frame returned by the loaders: its fetch time
+    plus row count. Changes whenever the sheet is re-read (after the read
+    TTL or any write), so derived caches can take the frame itself as an
+    unhashed ``_df`` argument instead of hashing every row."""
+    return (df.attrs.get("fetched_at"), len(df))
+
+
 def load_csv(name: str) -> pd.DataFrame:
     """Load a worksheet from Google Sheets. Uses a short cache to stay
-    within the 60-reads-per-minute API quota."""
+    within the 60-reads-per-minute API quota. The ``date`` column comes
+    back already parsed to datetime64, so callers can use ``.dt`` directly."""
     try:
-        conn = _get_conn()
-        df = conn.read(worksheet=name, ttl=_READ_TTL)
-        if df is None:
-            return pd.DataFrame()
-        # Drop fully-empty rows that gsheets sometimes returns
-        df = df.dropna(how="all")
-        if df.empty:
-            return pd.DataFrame()
-        # Clean date column -- handle "2026-02-01 0:00:00" format from Sheets
-        if "date" in df.columns:
-            df["date"] = df["date"].astype(str).str.split(" ").str[0]
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-        return df
+        return _read_worksheet_cached(name)
     except Exception as e:
         import streamlit as _st
         _st.warning(f"Could not load **{name}**: {e}")
         return pd.DataFrame()
 
 
+def _map_sheets(read: Callable[[str], pd.DataFrame], names: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """Run ``read`` for several worksheets concurrently, keyed by name.
+    The reads are independent Sheets round-trips, so threads overlap them
+    on a cold cache. Only sheets that actually need a fetch go to the pool;
+    warm reruns stay on the main thread. Workers inherit the script context
+    so st.* calls (cache, connection, warnings) behave as on the main
+    thread. An exception from any read propagates."""
+    names = list(names)
+    cold = [name for name in names if not _is_warm(name)]
+    if len(cold) <= 1:
+        return {name: read(name) for name in names}
+
+    ctx = get_script_run_ctx()
+
+    def _load(name: str) -> pd.DataFrame:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return read(name)
+
+    with ThreadPoolExecutor(max_workers=len(cold)) as pool:
+        fetched = dict(zip(cold, pool.map(_load, cold)))
+    return {name: fetched[name] if name in fetched else read(name) for name in names}
+
+
+def load_sheets(names: Iterable[str]) -> Dict[str, pd.DataFrame]:
+    """Load several worksheets concurrently with load_csv, keyed by name
+    (a sheet that fails to load comes back empty, with a warning)."""
+    return _map_sheets(load_csv, names)
+
+
 def _clear_read_cache() -> None:
     """Bust the Streamlit cache so the next load_csv call fetches fresh data."""
     st.cache_data.clear()
+    _fetched_at.clear()
+    _putting_testing_shared.clear()
 
 
 def save_csv(name: str, df: pd.DataFrame) -> None:
@@ -64,10 +160,10 @@ def save_csv(name: str, df: pd.DataFrame) -> None:
     conn = _get_conn()
     df_out = df.copy()
     for col in df_out.columns:
+        if col == "date" and not pd.api.types.is_datetime64_any_dtype(df_out[col]):
+            df_out[col] = pd.to_datetime(df_out[col], format="ISO8601", errors="coerce")
         if pd.api.types.is_datetime64_any_dtype(df_out[col]):
             df_out[col] = df_out[col].dt.strftime("%Y-%m-%d")
-        if col == "date":
-            df_out[col] = df_out[col].astype(str).str.split(" ").str[0]
     conn.update(worksheet=name, data=df_out)
     _clear_read_cache()
 
@@ -77,32 +173,113 @@ def _read_worksheet_strict(name: str) -> pd.DataFrame:
     Used by write operations so a temporary read failure never causes
     an accidental overwrite of existing data."""
     conn = _get_conn()
-    df = conn.read(worksheet=name, ttl=0)
-    if df is None:
-        return pd.DataFrame()
-    df = df.dropna(how="all")
-    if df.empty:
-        return pd.DataFrame()
-    if "date" in df.columns:
-        df["date"] = df["date"].astype(str).str.split(" ").str[0]
-        df["date"] = pd.to_datetime(df["date"], errors="coerce")
-    return df
+    return _clean_worksheet(conn.read(worksheet=name, ttl=0))
+
+
+# Service-account fields of [connections.gsheets] in secrets.toml
+_SERVICE_ACCOUNT_KEYS = (
+    "type", "project_id", "private_key_id", "private_key", "client_email", "client_id",
+    "auth_uri", "token_uri", "auth_provider_x509_cert_url", "client_x509_cert_url",
+)
+
+
+@st.cache_resource(show_spinner=False)
+def _gspread_spreadsheet():
+    """The practice spreadsheet opened through gspread's public API with
+    the same service-account credentials st-gsheets-connection uses.
+    Returns None when the connection isn't a service account (e.g. a
+    public, read-only sheet). A failure raises and is not cached."""
+    import gspread
+
+    cfg = st.secrets["connections"]["gsheets"]
+    if cfg.get("type") != "service_account":
+        return None
+    client = gspread.service_account_from_dict({k: cfg[k] for k in _SERVICE_ACCOUNT_KEYS if k in cfg})
+    spreadsheet = cfg["spreadsheet"]
+    if spreadsheet.startswith("http"):
+        return client.open_by_url(spreadsheet)
+    return client.open_by_key(spreadsheet)
+
+
+def _remote_worksheet(name: str):
+    """gspread worksheet for single-row writes, or None (logged) when that
+    path isn't available and callers should fall back to a full rewrite."""
+    try:
+        spreadsheet = _gspread_spreadsheet()
+        if spreadsheet is None:
+            _log.info("No service-account credentials; rewriting %s in full", name)
+            return None
+        return spreadsheet.worksheet(name)
+    except Exception:
+        _log.warning("Single-row write path unavailable for %s; rewriting in full", name, exc_info=True)
+        return None
+
+
+def _append_row_remote(name: str, row: dict) -> bool:
+    """Append ``row`` as one new worksheet row via the gspread worksheet,
+    without re-sending the rest of the sheet. Returns False
+    (nothing written) when that path isn't available: no service-account
+    client, an empty sheet, or a row with columns the header lacks."""
+    ws = _remote_worksheet(name)
+    if ws is None:
+        return False
+    header = ws.row_values(1)
+    if not header or not set(row) <= set(header):
+        _log.info("Header of %s lacks the new row's columns; rewriting in full", name)
+        return False
+    values = [row.get(col, "") for col in header]
+    values = [v.item() if isinstance(v, np.generic) else v for v in values]
+    # USER_ENTERED so the date lands as a date; every other text cell (notes,
+    # drill fields) gets a leading ' so "=...", "+1" or "3/4" stay literal text
+    values = [
+        f"'{v}" if isinstance(v, str) and v and col != "date" else v
+        for col, v in zip(header, values)
+    ]
+    ws.append_row(values, value_input_option="USER_ENTERED")
+    return True
 
 
 def append_csv_row(name: str, row: dict) -> None:
     """Append a single row to a Google Sheets worksheet.
-    Uses strict (uncached) read so a connection blip raises an error
+    Appends just the new row when the sheet header already has all its
+    columns; otherwise falls back to read-concat-rewrite. That fallback
+    uses a strict (uncached) read so a connection blip raises an error
     instead of silently overwriting all existing data."""
+    if _append_row_remote(name, row):
+        _clear_read_cache()
+        return
     df = _read_worksheet_strict(name)
     new_row = pd.DataFrame([row])
     df = pd.concat([df, new_row], ignore_index=True)
     save_csv(name, df)
 
 
+def _delete_row_remote(name: str, idx: int) -> bool:
+    """Delete the worksheet row behind DataFrame index ``idx`` (the header
+    is sheet row 1, so frame row 0 is sheet row 2) via the gspread
+    worksheet, without re-reading or re-sending the rest of the
+    sheet. Returns False (nothing deleted) when no service-account client
+    is available or ``idx`` is past the last data row."""
+    ws = _remote_worksheet(name)
+    if ws is None:
+        return False
+    # Data rows end at the last filled cell of column A (the date on every
+    # sheet); row_count is the grid size, typically 1000 blank rows
+    n_rows = len(ws.col_values(1)) - 1
+    if not 0 <= idx < n_rows:
+        return False
+    ws.delete_rows(idx + 2)
+    return True
+
+
 def delete_csv_row(name: str, idx: int) -> None:
     """Delete a row by index from a Google Sheets worksheet.
-    Uses strict (uncached) read so a connection blip raises an error
-    instead of silently wiping the sheet."""
+    Deletes just that row when the gspread client is available; otherwise
+    falls back to a strict (uncached) read and rewrite, so a connection
+    blip raises an error instead of silently wiping the sheet."""
+    if _delete_row_remote(name, idx):
+        _clear_read_cache()
+        return
     df = _read_worksheet_strict(name)
     if 0 <= idx < len(df):
         df = df.drop(index=idx).reset_index(drop=True)
@@ -121,14 +298,38 @@ def load_json(name: str) -> Any:
     """Load a JSON file from the data directory. Returns None if missing."""
     path = _json_path(name)
     if path.exists():
+        if orjson is not None:
+            return orjson.loads(path.read_bytes())
         with open(path, "r") as f:
             return json.load(f)
     return None
 
 
+def _json_mtime(name: str) -> float:
+    """Modification time of a data JSON file (0.0 if missing)."""
+    try:
+        return _json_path(name).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+@st.cache_resource(show_spinner=False)
+def _load_json_shared(name: str, mtime: float) -> Any:
+    """load_json memoized per process, keyed on the file's mtime so an
+    edited or re-imported file is picked up on the next call."""
+    return load_json(name)
+
+
 def save_json(name: str, data: Any) -> None:
     """Write data to a JSON file in the data directory."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        _json_path(name).write_bytes(orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        ))
+        return
     with open(_json_path(name), "w") as f:
         json.dump(data, f, indent=2, default=str)
 
@@ -149,28 +350,90 @@ def load_testing() -> pd.DataFrame:
     return load_csv("testing")
 
 
+def _sorted_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort oldest-first by date, keeping the worksheet row numbers as the
+    index so delete_csv_row still gets the right row."""
+    if "date" not in df.columns:
+        return df
+    return df.sort_values("date", kind="stable")
+
+
 def load_three_hole_loop() -> pd.DataFrame:
-    return load_csv("three_hole_loop")
+    """3-hole loop rounds, oldest first, with the Y/N flag columns as
+    nullable booleans (True/False, <NA> when blank) and the hole scores
+    as nullable Int16 (<NA> when blank, not a number, or not a whole
+    number, so a hand-edited cell can't break the cast)."""
+    df = load_csv("three_hole_loop")
+    for col in df.columns:
+        if col.endswith(_LOOP_FLAG_SUFFIXES):
+            df[col] = df[col].map({"Y": True, "N": False}).astype("boolean")
+        elif col.endswith("_score"):
+            scores = pd.to_numeric(df[col], errors="coerce")
+            whole = scores.mod(1).eq(0) & scores.abs().lt(2**15)
+            df[col] = scores.where(whole).astype("Int16")
+    return _sorted_by_date(df)
 
 
 def load_wedge_ladder() -> pd.DataFrame:
-    return load_csv("wedge_ladder")
+    """Wedge ladder sessions, oldest first."""
+    return _sorted_by_date(load_csv("wedge_ladder"))
+
+
+# Numeric columns on the putting_testing sheet, plus every lag_* count and
+# ld_h* make flag (1/0; blank on rows from other tests)
+_PUTTING_NUMERIC_COLS = ("score", "putting_hcp")
+_PUTTING_NUMERIC_PREFIXES = ("lag_", "ld_h")
+
+
+def _as_number(s: pd.Series) -> pd.Series:
+    """Coerce a worksheet column to numbers (blanks/junk -> NaN); columns
+    that already came back numeric are returned as-is."""
+    if pd.api.types.is_numeric_dtype(s):
+        return s
+    return pd.to_numeric(s, errors="coerce")
+
+
+@st.cache_resource(ttl=_READ_TTL, show_spinner=False)
+def _putting_testing_shared() -> pd.DataFrame:
+    """Typed putting_testing frame, shared across reruns without a copy.
+    A failed read raises and is not cached."""
+    df = _read_worksheet_cached("putting_testing")
+    for col in df.columns:
+        if col in _PUTTING_NUMERIC_COLS or col.startswith(_PUTTING_NUMERIC_PREFIXES):
+            df[col] = _as_number(df[col])
+    return df
 
 
 def load_putting_testing() -> pd.DataFrame:
-    return load_csv("putting_testing")
+    """Putting test sessions with score, putting_hcp, the lag drill counts
+    and the Luke Donald make flags already numeric. Shared, read-only
+    frame: callers must not mutate it (filter or ``.copy()`` first)."""
+    try:
+        return _putting_testing_shared()
+    except Exception as e:
+        st.warning(f"Could not load **putting_testing**: {e}")
+        return pd.DataFrame()
 
 
 def load_goals() -> Optional[dict]:
-    return load_json("goals")
+    """Shared, read-only goals. Callers must not mutate it."""
+    return _load_json_shared("goals", _json_mtime("goals"))
 
 
 def load_drills() -> Optional[dict]:
-    return load_json("drills")
+    """Shared, read-only drill list. Callers must not mutate it."""
+    return _load_json_shared("drills", _json_mtime("drills"))
 
 
 def load_testing_lookup() -> Optional[dict]:
-    return load_json("testing_lookup")
+    """Shared, read-only handicap lookup tables. Callers must not mutate it."""
+    return _load_json_shared("testing_lookup", _json_mtime("testing_lookup"))
+
+
+def testing_lookup_version() -> float:
+    """Cheap version token for the lookup tables (the file's mtime), for
+    keying caches derived from load_testing_lookup."""
+    return _json_mtime("testing_lookup")
 
 
 # ---------------------------------------------------------------------------
@@ -205,24 +468,94 @@ def save_putting_testing_session(row: dict) -> None:
 # Aggregation helpers (used by the dashboard)
 # ---------------------------------------------------------------------------
 
-def all_practice_dates() -> List[date]:
-    """Return a sorted list of all unique dates across all practice types."""
-    dates = set()
-    for name in ("ball_striking", "putting", "testing", "three_hole_loop", "wedge_ladder", "putting_testing"):
-        df = load_csv(name)
-        if not df.empty and "date" in df.columns:
-            for d in pd.to_datetime(df["date"]).dt.date:
-                dates.add(d)
-    return sorted(dates)
+# Worksheets that count as practice sessions on the dashboard
+PRACTICE_SHEETS = ("ball_striking", "putting", "testing", "three_hole_loop", "wedge_ladder", "putting_testing")
 
 
-def practice_session_counts() -> Dict[str, int]:
-    """Return total session counts per practice category."""
-    counts = {}
-    for name in ("ball_striking", "putting", "testing", "three_hole_loop", "wedge_ladder", "putting_testing"):
-        df = load_csv(name)
-        counts[name] = len(df)
-    return counts
+def _sessions_frame(frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """One row per logged session: normalized ``date`` plus the worksheet
+    name as ``category``."""
+    parts = []
+    for name, df in frames.items():
+        if df.empty:
+            continue
+        dates = df["date"] if "date" in df.columns else pd.Series(pd.NaT, index=df.index)
+        parts.append(pd.DataFrame({
+            "date": dates.dt.normalize(),
+            "category": name,
+        }))
+    if not parts:
+        return pd.DataFrame({
+            "date": pd.Series(dtype="datetime64[ns]"),
+            "category": pd.Series(dtype=object),
+        })
+    return pd.concat(parts, ignore_index=True)
+
+
+def _session_dates(sessions: pd.DataFrame) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(sessions["date"].dropna().unique()).sort_values()
+
+
+def _session_counts(sessions: pd.DataFrame) -> Dict[str, int]:
+    counts = sessions["category"].value_counts()
+    return {name: int(counts.get(name, 0)) for name in PRACTICE_SHEETS}
+
+
+# The cached aggregates read through _read_worksheet_cached, which raises:
+# a failed or rate-limited read is never cached as "no sessions". The public
+# wrappers below fall back to an uncached per-sheet load_csv pass, which
+# warns about (and skips) just the sheets that failed.
+
+@st.cache_data(ttl=_READ_TTL, show_spinner=False)
+def _all_sessions_cached() -> pd.DataFrame:
+    return _sessions_frame(_map_sheets(_read_worksheet_cached, PRACTICE_SHEETS))
+
+
+@st.cache_data(ttl=_READ_TTL, show_spinner=False)
+def _practice_dates_cached() -> pd.DatetimeIndex:
+    return _session_dates(_all_sessions_cached())
+
+
+@st.cache_data(ttl=_READ_TTL, show_spinner=False)
+def _session_counts_cached() -> Dict[str, int]:
+    return _session_counts(_all_sessions_cached())
+
+
+def load_all_sessions() -> pd.DataFrame:
+    """Return one row per logged session across all practice types, with a
+    normalized ``date`` column and the worksheet name as ``category``."""
+    try:
+        return _all_sessions_cached()
+    except Exception:
+        return _sessions_frame(load_sheets(PRACTICE_SHEETS))
+
+
+def all_practice_dates(sessions: Optional[pd.DataFrame] = None) -> pd.DatetimeIndex:
+    """Return the sorted unique (normalized) dates across all practice types,
+    from ``sessions`` (a load_all_sessions frame) when given."""
+    if sessions is not None:
+        return _session_dates(sessions)
+    try:
+        return _practice_dates_cached()
+    except Exception:
+        return _session_dates(load_all_sessions())
+
+
+def practice_session_counts(sessions: Optional[pd.DataFrame] = None) -> Dict[str, int]:
+    """Return total session counts per practice category, from ``sessions``
+    (a load_all_sessions frame) when given."""
+    if sessions is not None:
+        return _session_counts(sessions)
+    try:
+        return _session_counts_cached()
+    except Exception:
+        return _session_counts(load_all_sessions())
+
+
+def _day_numbers(dates) -> np.ndarray:
+    """Sorted unique day numbers (days since the epoch) for the given dates."""
+    days = pd.DatetimeIndex(dates).dropna().values.astype("datetime64[D]")
+    return np.unique(days.astype(np.int64))
 
 
 def current_streak(dates=None) -> int:
@@ -230,35 +563,25 @@ def current_streak(dates=None) -> int:
     (or the most recent practice day)."""
     if dates is None:
         dates = all_practice_dates()
-    if not dates:
+    days = _day_numbers(dates)
+    if days.size == 0:
+        return 0
+    today = np.datetime64(date.today(), "D").astype(np.int64)
+    check = min(days[-1], today)
+    days = days[days <= check]
+    if days.size == 0 or days[-1] != check:
         return 0
-    today = date.today()
-    if dates[-1] < today:
-        check = dates[-1]
-    else:
-        check = today
-    streak = 0
-    for d in reversed(dates):
-        if d == check:
-            streak += 1
-            check = date.fromordinal(check.toordinal() - 1)
-        elif d < check:
-            break
-    return streak
+    breaks = np.flatnonzero(np.diff(days) != 1)
+    return int(days.size - (breaks[-1] + 1 if breaks.size else 0))
 
 
 def longest_streak(dates=None) -> int:
     """Calculate the longest consecutive-day practice streak."""
     if dates is None:
         dates = all_practice_dates()
-    if not dates:
+    days = _day_numbers(dates)
+    if days.size == 0:
         return 0
-    best = 1
-    run = 1
-    for i in range(1, len(dates)):
-        if (dates[i].toordinal() - dates[i - 1].toordinal()) == 1:
-            run += 1
-            best = max(best, run)
-        else:
-            run = 1
-    return best
+    breaks = np.flatnonzero(np.diff(days) != 1)
+    runs = np.diff(np.r_[-1, breaks, days.size - 1])
+    return int(runs.max())
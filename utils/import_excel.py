@@ -1,6 +1,8 @@
 """
 One-time importer: reads Golf 2026.xlsx and writes structured CSV/JSON
-files into the data/ directory.  Safe to re-run (overwrites).
+files into the data/ directory.  Safe to re-run (overwrites); skipped
+when neither the workbook nor any output file has changed since the
+last import (pass --force to re-import anyway).
 
 Usage:
     python -m utils.import_excel            (from project root)
@@ -14,17 +16,58 @@ from pathlib import Path
 import openpyxl
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; falls back to the stdlib json module
+    orjson = None
+
 # Resolve paths regardless of how the script is invoked
 _SCRIPT_DIR = Path(__file__).resolve().parent
 _PROJECT_DIR = _SCRIPT_DIR.parent
 _DATA_DIR = _PROJECT_DIR / "data"
 _EXCEL_PATH = _PROJECT_DIR / "Golf 2026.xlsx"
+# Workbook and output-file mtimes recorded by the last successful import
+_MTIME_PATH = _DATA_DIR / ".import_mtime"
+# Every file run_import writes into data/
+_OUTPUT_FILES = (
+    "goals.json", "ball_striking.csv", "putting.csv", "short_game.csv",
+    "drills.json", "testing_lookup.json", "testing.csv",
+)
 
 
 def _ensure_dirs():
     _DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _import_state(excel_path: Path) -> dict:
+    """mtime_ns of the workbook and of each output file (None if missing)."""
+    outputs = {}
+    for name in _OUTPUT_FILES:
+        path = _DATA_DIR / name
+        outputs[name] = path.stat().st_mtime_ns if path.exists() else None
+    return {"workbook": excel_path.stat().st_mtime_ns, "outputs": outputs}
+
+
+def _up_to_date(excel_path: Path) -> bool:
+    """True when the workbook is unchanged and every output still exists,
+    untouched, since the last import (a deleted, edited or checked-out
+    output changes its mtime and forces a re-import)."""
+    try:
+        recorded = json.loads(_MTIME_PATH.read_text())
+    except (OSError, ValueError):
+        return False
+    state = _import_state(excel_path)
+    return None not in state["outputs"].values() and recorded == state
+
+
+def _write_json(path: Path, data) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
 # ---------------------------------------------------------------------------
 # Goals
 # ---------------------------------------------------------------------------
@@ -36,9 +79,9 @@ def _import_goals(wb: openpyxl.Workbook) -> dict:
     section = None
     current_sub = None
 
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, values_only=False):
-        a_val = row[0].value
-        b_val = row[1].value if len(row) > 1 else None
+    for row in ws.iter_rows(min_row=1, values_only=True):
+        a_val = row[0] if row else None
+        b_val = row[1] if len(row) > 1 else None
 
         # Detect section headers
         if a_val == "Big Goals":
@@ -96,22 +139,25 @@ _SHORT_GAME_COLS = [
 ]
 
 
+def _format_dates(values: pd.Series) -> pd.Series:
+    """Format a column of Excel dates as YYYY-MM-DD in one vectorized pass
+    (blank or unparseable cells stay empty)."""
+    return pd.to_datetime(values, errors="coerce").dt.strftime("%Y-%m-%d")
+
+
 def _import_practice_sheet(wb, sheet_name, columns) -> pd.DataFrame:
     ws = wb[sheet_name]
-    rows = []
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, values_only=True):
-        if row[0] is None:
-            continue
-        record: dict = {}
-        for i, col_name in enumerate(columns):
-            val = row[i] if i < len(row) else None
-            if col_name == "date" and val is not None:
-                val = pd.Timestamp(val).strftime("%Y-%m-%d")
-            record[col_name] = val
-        rows.append(record)
+    # max_col trims each row to the known columns and pads short ones with None
+    rows = [
+        row
+        for row in ws.iter_rows(min_row=2, max_col=len(columns), values_only=True)
+        if row[0] is not None
+    ]
     if not rows:
         return pd.DataFrame(columns=columns)
-    return pd.DataFrame(rows, columns=columns)
+    df = pd.DataFrame(rows, columns=columns)
+    df["date"] = _format_dates(df["date"])
+    return df
 
 
 # ---------------------------------------------------------------------------
@@ -121,16 +167,16 @@ def _import_practice_sheet(wb, sheet_name, columns) -> pd.DataFrame:
 def _import_drills(wb: openpyxl.Workbook) -> list[dict]:
     ws = wb["Description"]
     drills = []
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row, values_only=False):
-        name = row[0].value
+    for row in ws.iter_rows(min_row=3, values_only=True):
+        name = row[0] if row else None
         if not name:
             continue
         levels = {}
         for i, level_label in enumerate(["Level 1", "Level 2", "Level 3", "Level 4"], start=1):
-            val = row[i].value if i < len(row) else None
+            val = row[i] if i < len(row) else None
             if val:
                 levels[level_label] = str(val)
-        desc = row[6].value if len(row) > 6 else None
+        desc = row[6] if len(row) > 6 else None
         drills.append({
             "name": str(name),
             "levels": levels,
@@ -144,26 +190,27 @@ def _import_drills(wb: openpyxl.Workbook) -> list[dict]:
 # ---------------------------------------------------------------------------
 
 def _import_testing(wb: openpyxl.Workbook) -> tuple[dict, pd.DataFrame]:
-    ws = wb["Testing"]
+    # Both tables below come from this sheet: stream it once (a read-only
+    # worksheet re-parses its XML on every iter_rows call)
+    sheet_rows = list(wb["Testing"].iter_rows(values_only=True))
 
     # --- Lookup tables (columns P onward, rows 2-9) ---
     lookup: dict[str, list[dict]] = {}
-    # Row 1 has the index numbers 1..27 in Q1..AQ1
-    indices = []
-    for col_idx in range(17, ws.max_column + 1):  # Q=17 (1-indexed)
-        val = ws.cell(row=1, column=col_idx).value
-        if val is not None:
-            indices.append(int(val))
-
-    for row_idx in range(2, 10):  # rows 2-9
-        shot_name = ws.cell(row=row_idx, column=16).value  # column P
+    # Rows 1-9 from column P (index 15): row 1 has the index numbers 1..27
+    # in Q1..AQ1, rows 2-9 a shot name then its handicaps
+    table = [row[15:] for row in sheet_rows[:9]]
+    header = table[0] if table else ()
+    indices = [int(val) for val in header[1:] if val is not None]
+
+    for row in table[1:]:
+        shot_name = row[0] if row else None
         if not shot_name:
             continue
-        handicaps = []
-        for i, col_idx in enumerate(range(17, 17 + len(indices))):
-            val = ws.cell(row=row_idx, column=col_idx).value
-            if val is not None:
-                handicaps.append({"score": indices[i], "handicap": float(val)})
+        handicaps = [
+            {"score": score, "handicap": float(val)}
+            for score, val in zip(indices, row[1:])
+            if val is not None
+        ]
         lookup[str(shot_name)] = handicaps
 
     # --- Test results (columns A-M, row 3 onward) ---
@@ -172,23 +219,20 @@ def _import_testing(wb: openpyxl.Workbook) -> tuple[dict, pd.DataFrame]:
         "50_yards_f", "30_yards_f", "10_f_chip", "20_yards_r",
         "flop", "15_f_pitch", "8_yard_sand", "15_yard_sand",
     ]
-    results = []
-    for row in ws.iter_rows(min_row=3, max_row=ws.max_row, values_only=True):
-        if row[0] is None:
-            continue
-        record = {}
-        for i, col_name in enumerate(test_cols):
-            val = row[i] if i < len(row) else None
-            if col_name == "date" and val is not None:
-                val = pd.Timestamp(val).strftime("%Y-%m-%d")
-            elif isinstance(val, str) and val.startswith("="):
-                val = None  # skip formulas
-            elif val == "na":
-                val = None
-            record[col_name] = val
-        results.append(record)
-
-    results_df = pd.DataFrame(results, columns=test_cols) if results else pd.DataFrame(columns=test_cols)
+    n_cols = len(test_cols)
+    results = [
+        row[:n_cols] + (None,) * (n_cols - len(row))
+        for row in sheet_rows[2:]
+        if row and row[0] is not None
+    ]
+
+    if not results:
+        return lookup, pd.DataFrame(columns=test_cols)
+    results_df = pd.DataFrame(results, columns=test_cols)
+    # Blank out formula text and "na" placeholders column-wise
+    text = results_df.astype(str)
+    results_df = results_df.mask(text.apply(lambda col: col.str.startswith("=")) | text.eq("na"))
+    results_df["date"] = _format_dates(results_df["date"])
     return lookup, results_df
 
 
@@ -196,19 +240,25 @@ def _import_testing(wb: openpyxl.Workbook) -> tuple[dict, pd.DataFrame]:
 # Main
 # ---------------------------------------------------------------------------
 
-def run_import(excel_path=None):
+def run_import(excel_path=None, force=False):
     excel_path = excel_path or _EXCEL_PATH
     if not excel_path.exists():
         print(f"Excel file not found: {excel_path}")
         sys.exit(1)
 
+    # Skip the workbook parse when nothing changed since the last import
+    if not force and _up_to_date(excel_path):
+        print("  Workbook and data files unchanged since the last import, nothing to do "
+              "(use --force to re-import).")
+        return
+
     _ensure_dirs()
-    wb = openpyxl.load_workbook(str(excel_path), data_only=True)
+    # read_only streams rows from the XML instead of building every cell
+    wb = openpyxl.load_workbook(str(excel_path), data_only=True, read_only=True)
 
     # Goals
     goals = _import_goals(wb)
-    with open(_DATA_DIR / "goals.json", "w") as f:
-        json.dump(goals, f, indent=2)
+    _write_json(_DATA_DIR / "goals.json", goals)
     print(f"  goals.json  ({len(goals['big_goals'])} big, "
           f"{len(goals['component_goals'])} component, "
           f"{sum(len(v) for v in goals['sub_goals'].values())} sub-goals)")
@@ -228,23 +278,22 @@ def run_import(excel_path=None):
 
     # Drills
     drills = _import_drills(wb)
-    with open(_DATA_DIR / "drills.json", "w") as f:
-        json.dump(drills, f, indent=2)
+    _write_json(_DATA_DIR / "drills.json", drills)
     print(f"  drills.json  ({len(drills)} drills)")
 
     # Testing
     lookup, test_df = _import_testing(wb)
-    with open(_DATA_DIR / "testing_lookup.json", "w") as f:
-        json.dump(lookup, f, indent=2)
+    _write_json(_DATA_DIR / "testing_lookup.json", lookup)
     print(f"  testing_lookup.json  ({len(lookup)} shot types)")
 
     test_df.to_csv(_DATA_DIR / "testing.csv", index=False)
     print(f"  testing.csv  ({len(test_df)} test sessions)")
 
     wb.close()
+    _MTIME_PATH.write_text(json.dumps(_import_state(excel_path)))
     print("\nImport complete!")
 
 
 if __name__ == "__main__":
     print("Importing Golf 2026.xlsx ...")
-    run_import()
+    run_import(force="--force" in sys.argv[1:])
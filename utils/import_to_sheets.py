@@ -3,11 +3,12 @@ One-time script to upload existing CSV data into Google Sheets worksheets.
 Run from project root: python utils/import_to_sheets.py
 """
 
+import csv
+import math
 import sys
 from pathlib import Path
 
 import gspread
-import pandas as pd
 from google.oauth2.service_account import Credentials
 
 _PROJECT_DIR = Path(__file__).resolve().parent.parent
@@ -22,6 +23,13 @@ WORKSHEETS = [
     "three_hole_loop",
 ]
 
+# Columns holding typed-in text: uploaded exactly as written, never as numbers
+TEXT_COLUMNS = {"notes"}
+
+# Rows per values_batch_update request, so a large history is sent as
+# several modest request bodies instead of one huge one
+UPLOAD_CHUNK_ROWS = 5000
+
 # Google API scopes
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -38,6 +46,49 @@ def _load_secrets():
     return toml.load(secrets_path)
 
 
+def _typed_cell(text):
+    """Return a CSV cell as an int or float when it is a finite number,
+    otherwise the text unchanged (blanks stay "")."""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return number if math.isfinite(number) else text
+
+
+def _typed_rows(rows):
+    """Convert ``[header, *rows]`` CSV text to the values uploaded with RAW:
+    numbers become numbers, dates stay ISO strings (parsed by the app's
+    reader), and TEXT_COLUMNS are left as plain text."""
+    header, body = rows[0], rows[1:]
+    text_idx = {i for i, col in enumerate(header) if col in TEXT_COLUMNS}
+    return [header] + [
+        [cell if i in text_idx else _typed_cell(cell) for i, cell in enumerate(row)]
+        for row in body
+    ]
+
+
+def _upload_batches(payload):
+    """Yield ``data`` lists for values_batch_update holding at most
+    UPLOAD_CHUNK_ROWS rows each. Sheets are split into row blocks anchored
+    at their own A<row> cell; small sheets share one request."""
+    batch, batch_rows = [], 0
+    for ws_name, values in payload.items():
+        for start in range(0, len(values), UPLOAD_CHUNK_ROWS):
+            block = values[start:start + UPLOAD_CHUNK_ROWS]
+            if batch and batch_rows + len(block) > UPLOAD_CHUNK_ROWS:
+                yield batch
+                batch, batch_rows = [], 0
+            batch.append({"range": f"'{ws_name}'!A{start + 1}", "values": block})
+            batch_rows += len(block)
+    if batch:
+        yield batch
+
+
 def run_import():
     secrets = _load_secrets()
     gsheets_config = secrets["connections"]["gsheets"]
@@ -62,45 +113,66 @@ def run_import():
 
     spreadsheet = client.open_by_url(spreadsheet_url)
 
+    # Collect every worksheet's values first, then write them in batches
+    payload = {}
     for ws_name in WORKSHEETS:
         csv_path = _DATA_DIR / f"{ws_name}.csv"
         if not csv_path.exists():
             print(f"  {ws_name}: no CSV file, skipping")
             continue
 
-        df = pd.read_csv(csv_path)
-        if df.empty:
+        # [header, *rows] with numeric cells typed; dates are ISO strings
+        # from the Excel importer and blanks stay ""
+        with open(csv_path, newline="") as f:
+            rows = [row for row in csv.reader(f) if row]
+        if rows:
+            rows = _typed_rows(rows)
+        if len(rows) <= 1:
             print(f"  {ws_name}: CSV is empty, creating empty worksheet")
-            try:
-                ws = spreadsheet.worksheet(ws_name)
-                ws.clear()
-                # Write just headers
-                ws.update([df.columns.tolist()])
-            except gspread.WorksheetNotFound:
-                ws = spreadsheet.add_worksheet(title=ws_name, rows=1, cols=len(df.columns) or 1)
-                if not df.columns.empty:
-                    ws.update([df.columns.tolist()])
+            # Write just headers
+            payload[ws_name] = rows
             continue
 
-        # Convert datetime columns to strings
-        for col in df.columns:
-            if "date" in col.lower():
-                df[col] = pd.to_datetime(df[col], errors="coerce").dt.strftime("%Y-%m-%d")
-
-        # Replace NaN with empty strings for Sheets
-        df = df.fillna("")
-
-        # Get or create the worksheet
-        try:
-            ws = spreadsheet.worksheet(ws_name)
-            ws.clear()
-        except gspread.WorksheetNotFound:
-            ws = spreadsheet.add_worksheet(title=ws_name, rows=len(df) + 1, cols=len(df.columns))
-
-        # Write header + data
-        data = [df.columns.tolist()] + df.values.tolist()
-        ws.update(data)
-        print(f"  {ws_name}: {len(df)} rows uploaded")
+        payload[ws_name] = rows
+
+    if not payload:
+        print("\nNothing to import.")
+        return
+
+    # Size every target worksheet to its data in one request: create the
+    # missing ones, and clear + resize the existing ones so no stale rows
+    # or columns from an earlier, larger import are left behind
+    existing = {ws.title: ws for ws in spreadsheet.worksheets()}
+    sheet_requests = []
+    for ws_name, values in payload.items():
+        grid = {
+            "rowCount": max(len(values), 1),
+            "columnCount": len(values[0]) if values else 1,
+        }
+        ws = existing.get(ws_name)
+        if ws is None:
+            sheet_requests.append({"addSheet": {"properties": {"title": ws_name, "gridProperties": grid}}})
+            continue
+        # Sheets rejects a grid that would leave no unfrozen row/column
+        # (e.g. a header-only CSV on a sheet with a frozen header row)
+        grid["rowCount"] = max(grid["rowCount"], ws.frozen_row_count + 1)
+        grid["columnCount"] = max(grid["columnCount"], ws.frozen_col_count + 1)
+        sheet_requests.append({"updateCells": {"range": {"sheetId": ws.id}, "fields": "userEnteredValue"}})
+        sheet_requests.append({"updateSheetProperties": {
+            "properties": {"sheetId": ws.id, "gridProperties": grid},
+            "fields": "gridProperties(rowCount,columnCount)",
+        }})
+    spreadsheet.batch_update({"requests": sheet_requests})
+
+    # Write them all (one update request unless the CSVs exceed
+    # UPLOAD_CHUNK_ROWS rows in total).
+    # RAW: values are already typed above, so Sheets must not re-parse free
+    # text (a note like "=..." or "3/4" would become a formula or a date).
+    for data in _upload_batches(payload):
+        spreadsheet.values_batch_update(body={"valueInputOption": "RAW", "data": data})
+    for ws_name, values in payload.items():
+        if len(values) > 1:
+            print(f"  {ws_name}: {len(values) - 1} rows uploaded")
 
     print("\nImport to Google Sheets complete!")
 